@@ -11,28 +11,19 @@ Auth / Identity module (Streamlit-friendly)
 
 from __future__ import annotations  # ✅ 반드시 여기!
 
-import os
 import re
-from typing import List
 
 import streamlit as st
 
+from app.core.config import ADMIN_EMAILS
 from app.core.logging import log_action
 
 
 # -----------------------------
 # Constants & Config
 # -----------------------------
-EMAIL_REGEX = re.compile(r"[^@]+@[^@]+\.[^@]+")
-
-
-def _get_admin_emails() -> List[str]:
-    """
-    .env 또는 환경변수의 ADMIN_EMAILS를 읽어옵니다.
-    예: ADMIN_EMAILS=admin@example.com,owner@example.com
-    """
-    raw = os.getenv("ADMIN_EMAILS", "")
-    return [e.strip().lower() for e in raw.split(",") if e.strip()]
+EMAIL_REGEX = re.compile(r"\A[^@\s]+@[^@\s]+\.[^@\s]+\Z")
+EMAIL_MAX_LEN = 254  # RFC 5321 주소 길이 상한
 
 
 # -----------------------------
@@ -42,8 +33,7 @@ def init_auth_state() -> None:
     """
     Streamlit session_state 초기화
     """
-    if "user_email" not in st.session_state:
-        st.session_state.user_email = None
+    st.session_state.setdefault("user_email", None)
 
 
 def is_logged_in() -> bool:
@@ -60,7 +50,29 @@ def current_user_email() -> str | None:
 # Validation
 # -----------------------------
 def is_valid_email(email: str) -> bool:
-    return bool(email) and bool(EMAIL_REGEX.match(email))
+    """
+    이메일 형식 검사
+    - ASCII 주소는 구조 검사(@ 1개, 도메인 내 '.', 공백 없음)만으로 판정
+    - 비 ASCII 주소만 정규식(fullmatch)으로 확인
+    """
+    if not email or "@" not in email:
+        return False
+
+    email = email.strip()
+    if len(email) > EMAIL_MAX_LEN:
+        return False
+
+    if not email.isascii():
+        return EMAIL_REGEX.fullmatch(email) is not None
+
+    local, _, domain = email.partition("@")
+    return (
+        bool(local)
+        and "@" not in domain
+        and "." in domain[1:-1]
+        and email.isprintable()
+        and " " not in email
+    )
 
 
 # -----------------------------
@@ -142,10 +154,14 @@ def logout_button(label: str = "로그아웃") -> None:
 def is_admin() -> bool:
     """
     현재 사용자가 관리자 이메일인지 확인
+    - ADMIN_EMAILS는 config에서 frozenset으로 한 번만 파싱됨
     """
+    if not ADMIN_EMAILS:
+        # 관리자 미설정(개발 환경 등): 세션 조회 없이 바로 False
+        return False
+
     email = current_user_email()
     if not email:
         return False
 
-    admin_emails = _get_admin_emails()
-    return email in admin_emails
+    return email in ADMIN_EMAILS
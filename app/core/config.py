@@ -4,13 +4,15 @@ Global App Configuration
 
 - 환경변수(.env) 기반 설정 로딩
 - 앱 전역에서 참조하는 상수 정의
+- get_config(): 프로세스당 1회만 파싱되는 설정 객체(AppConfig)
 """
 
 from __future__ import annotations
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List
 
 from dotenv import load_dotenv
 
@@ -18,8 +20,14 @@ from dotenv import load_dotenv
 # -----------------------------
 # Environment
 # -----------------------------
-# Streamlit 실행 시 한 번만 로딩되면 충분
-load_dotenv()
+@lru_cache(maxsize=1)
+def _load_env() -> bool:
+    """
+    .env 로딩 (프로세스당 1회)
+    - Streamlit rerun / 모듈 재import 시에도 파일을 다시 파싱하지 않음
+    """
+    load_dotenv()
+    return True
 
 
 # -----------------------------
@@ -36,38 +44,112 @@ FONTS_DIR: Path = ASSETS_DIR / "fonts"
 
 
 # -----------------------------
-# App Info
+# Admin
 # -----------------------------
-APP_NAME: str = os.getenv("APP_NAME", "Ad Creator Platform")
-ENV: str = os.getenv("ENV", "dev")  # dev | prod
+def _parse_admin_emails(raw: str) -> frozenset[str]:
+    # lower()는 전체 문자열에 1회, strip()은 원소당 1회
+    return frozenset(filter(None, (e.strip() for e in raw.lower().split(","))))
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    raw = (os.getenv(name) or "").strip().lower()
+    if not raw:
+        return default
+    return raw not in ("0", "false", "no", "off")
 
 
 # -----------------------------
-# Admin
+# Config Object
+# -----------------------------
+@dataclass(frozen=True)
+class AppConfig:
+    # App Info
+    app_name: str
+    env: str  # dev | prod
+
+    # Admin
+    admin_emails: frozenset[str]
+
+    # Image Generation
+    image_provider: str
+    image_save_format: str  # png | webp (webp: 무손실, 인코딩이 더 빠름)
+
+    # Pipeline
+    plan_cache_enabled: bool  # 비결정적 LLM 플랜 사용 시 False
+    history_enabled: bool  # 부하 테스트/프리뷰 환경에서는 False
+
+    # SMTP (Email)
+    smtp_host: str
+    smtp_port: int
+    smtp_user: str
+    smtp_from: str
+
+
+@lru_cache(maxsize=1)
+def get_config() -> AppConfig:
+    """
+    환경변수 기반 설정을 한 번만 읽어 캐시한다.
+    - 다른 모듈은 os.getenv 대신 get_config().<field>로 접근
+    """
+    _load_env()
+    return AppConfig(
+        app_name=os.getenv("APP_NAME", "Ad Creator Platform"),
+        env=os.getenv("ENV", "dev"),
+        admin_emails=_parse_admin_emails(os.getenv("ADMIN_EMAILS", "")),
+        image_provider=os.getenv("IMAGE_PROVIDER", "mock").lower(),
+        image_save_format=os.getenv("IMAGE_SAVE_FORMAT", "png").strip().lower() or "png",
+        plan_cache_enabled=_env_flag("PLAN_CACHE_ENABLED", True),
+        history_enabled=_env_flag("HISTORY_ENABLED", True),
+        smtp_host=os.getenv("SMTP_HOST", ""),
+        smtp_port=int(os.getenv("SMTP_PORT", "587")),
+        smtp_user=os.getenv("SMTP_USER", ""),
+        smtp_from=os.getenv("SMTP_FROM", ""),
+    )
+
+
+_CONFIG = get_config()
+
+
+# -----------------------------
+# App Info
 # -----------------------------
-def _parse_admin_emails(raw: str) -> List[str]:
-    return [e.strip().lower() for e in raw.split(",") if e.strip()]
+APP_NAME: str = _CONFIG.app_name
+ENV: str = _CONFIG.env  # dev | prod
 
 
-ADMIN_EMAILS: List[str] = _parse_admin_emails(os.getenv("ADMIN_EMAILS", ""))
+# -----------------------------
+# Admin
+# -----------------------------
+# 매 rerun마다 재파싱하지 않도록 import 시점에 한 번만 frozenset으로 고정
+ADMIN_EMAILS: frozenset[str] = _CONFIG.admin_emails
 
 
 # -----------------------------
 # Image Generation
 # -----------------------------
-IMAGE_PROVIDER: str = os.getenv("IMAGE_PROVIDER", "mock").lower()
+IMAGE_PROVIDER: str = _CONFIG.image_provider
+
+# 생성 이미지 저장 포맷 (지원하지 않는 값 / 환경이면 png로 저장)
+IMAGE_SAVE_FORMAT: str = _CONFIG.image_save_format
 
 # 기본 이미지 사이즈
 INSTAGRAM_FEED_SIZE = (1080, 1080)
 
 
+# -----------------------------
+# Pipeline
+# -----------------------------
+PLAN_CACHE_ENABLED: bool = _CONFIG.plan_cache_enabled
+HISTORY_ENABLED: bool = _CONFIG.history_enabled
+
+
 # -----------------------------
 # SMTP (Email)
 # -----------------------------
-SMTP_HOST: str = os.getenv("SMTP_HOST", "")
-SMTP_PORT: int = int(os.getenv("SMTP_PORT", "587"))
-SMTP_USER: str = os.getenv("SMTP_USER", "")
-SMTP_FROM: str = os.getenv("SMTP_FROM", "")
+SMTP_HOST: str = _CONFIG.smtp_host
+SMTP_PORT: int = _CONFIG.smtp_port
+SMTP_USER: str = _CONFIG.smtp_user
+SMTP_FROM: str = _CONFIG.smtp_from
 
 # ⚠️ SMTP_PASS는 보안상 여기서 변수로 노출하지 않고
 # email_service에서 직접 os.getenv으로 접근하는 것도 권장
@@ -41,6 +41,9 @@ def is_admin(email: Optional[str] = None) -> bool:
     """
     관리자 여부 확인
     """
+    if not ADMIN_EMAILS:
+        return False
+
     email = email or current_user_email()
     if not email:
         return False
@@ -102,7 +105,8 @@ def ensure_safe_path(
     base_dir = base_dir.resolve()
     target_path = target_path.resolve()
 
-    if not str(target_path).startswith(str(base_dir)):
+    # 경로 컴포넌트 단위 비교 (/foo/barbaz 가 /foo/bar 하위로 오인되지 않음)
+    if not target_path.is_relative_to(base_dir):
         raise ValueError("허용되지 않은 파일 접근입니다.")
 
     return target_path
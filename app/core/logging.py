@@ -10,8 +10,11 @@ Application Logging
 
 from __future__ import annotations
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
@@ -66,7 +69,7 @@ def _create_logger(
     if logger.handlers:
         return logger  # 중복 핸들러 방지
 
-    handler = RotatingFileHandler(
+    file_handler = RotatingFileHandler(
         file_path,
         maxBytes=5 * 1024 * 1024,  # 5MB
         backupCount=3,
@@ -74,10 +77,16 @@ def _create_logger(
     )
 
     formatter = logging.Formatter(DEFAULT_FORMAT, DATE_FORMAT)
-    handler.setFormatter(formatter)
-    handler.addFilter(ContextFilter())
+    file_handler.setFormatter(formatter)
+    file_handler.addFilter(ContextFilter())
 
-    logger.addHandler(handler)
+    # 요청 스레드는 큐에 넣기만 하고, 실제 파일 쓰기/rotation은 리스너 스레드가 담당
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # 종료 시 남은 레코드 flush
+
+    logger.addHandler(QueueHandler(log_queue))
     logger.propagate = False
     return logger
 
@@ -98,6 +107,19 @@ error_logger = _create_logger(
 )
 
 
+# -----------------------------
+# Adapters (user, action 별 1회 생성)
+# -----------------------------
+@lru_cache(maxsize=512)
+def _app_adapter(user: str, action: str) -> logging.LoggerAdapter:
+    return logging.LoggerAdapter(app_logger, {"user": user, "action": action})
+
+
+@lru_cache(maxsize=512)
+def _error_adapter(user: str, action: str) -> logging.LoggerAdapter:
+    return logging.LoggerAdapter(error_logger, {"user": user, "action": action})
+
+
 # -----------------------------
 # Helper Functions
 # -----------------------------
@@ -110,13 +132,7 @@ def log_action(
     """
     일반 사용자 행동 로그
     """
-    app_logger.info(
-        message,
-        extra={
-            "user": user or "-",
-            "action": action or "-",
-        },
-    )
+    _app_adapter(user or "-", action or "-").info(message)
 
 
 def log_error(
@@ -129,21 +145,32 @@ def log_error(
     """
     에러 로그
     """
-    error_logger.error(
-        message,
-        extra={
-            "user": user or "-",
-            "action": action or "-",
-        },
-        exc_info=exc,
-    )
+    _error_adapter(user or "-", action or "-").error(message, exc_info=exc)
+
+
+# 로그 tail 읽기 시작 윈도우 크기 (부족하면 2배씩 확장)
+_TAIL_WINDOW = 64 * 1024
 
 
 def read_recent_logs(limit: int = 50) -> list[str]:
-    if not LOG_FILE.exists():
+    """
+    최근 로그 limit줄
+    - 파일 끝에서부터 윈도우만큼만 읽음 (전체 파일 스캔 없음)
+    """
+    if limit <= 0 or not APP_LOG_PATH.exists():
         return []
 
-    with open(LOG_FILE, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    return lines[-limit:]
+    with open(APP_LOG_PATH, "rb") as f:
+        size = f.seek(0, 2)
+        window = _TAIL_WINDOW
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            lines = f.read().splitlines(keepends=True)
+            if start > 0:
+                lines = lines[1:]  # 윈도우 경계에서 잘린 첫 줄 제외
+            if start == 0 or len(lines) >= limit:
+                break
+            window *= 2
+
+    return [line.decode("utf-8", errors="replace") for line in lines[-limit:]]
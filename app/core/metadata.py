@@ -9,12 +9,12 @@ Ad Metadata Model
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class AdMetadata:
     # 기본 식별 정보
     image_id: str
@@ -38,11 +38,28 @@ class AdMetadata:
     # 생성 결과
     copy: Dict[str, str]
 
-    # 시스템 메타
-    created_at: str = datetime.utcnow().isoformat()
+    # 시스템 메타 (인스턴스 생성 시각 — 클래스 정의 시각이 아님)
+    created_at: str = field(
+        default_factory=lambda: datetime.now(timezone.utc).isoformat()
+    )
 
     def to_dict(self) -> Dict[str, Any]:
         """
         history.json에 저장하기 위한 dict 변환
+        - 필드가 평탄하므로 asdict()의 재귀 deepcopy 대신 직접 구성
         """
-        return asdict(self)
+        return {
+            "image_id": self.image_id,
+            "ad_type": self.ad_type,
+            "user_email": self.user_email,
+            "product": self.product,
+            "tone": self.tone,
+            "discount": self.discount,
+            "prompt": self.prompt,
+            "prompt_extra": self.prompt_extra,
+            "image_provider": self.image_provider,
+            "image_path": self.image_path,
+            "image_size": list(self.image_size),
+            "copy": dict(self.copy),
+            "created_at": self.created_at,
+        }
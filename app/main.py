@@ -24,6 +24,8 @@ if str(ROOT_DIR) not in sys.path:
 # -----------------------------
 # Imports
 # -----------------------------
+import importlib
+
 import streamlit as st
 
 from app.core.auth import login_gate, current_user_email
@@ -40,10 +42,36 @@ st.set_page_config(
 )
 
 
+# -----------------------------
+# Warmup (프로세스당 1회)
+# -----------------------------
+@st.cache_resource
+def _warmup_fonts() -> bool:
+    # 렌더 모듈(PIL/폰트) 로딩을 첫 광고 생성이 아닌 앱 시작 시점으로 이동
+    from app.services.render_service import warmup_fonts
+
+    warmup_fonts()
+    return True
+
+
+# -----------------------------
+# Routes (navbar key → page module)
+# -----------------------------
+# 페이지 추가는 이 dict에 한 줄 추가하면 됨.
+# importlib.import_module은 sys.modules를 먼저 조회하므로 rerun 시 dict lookup 수준.
+_ROUTES: dict[str, str] = {
+    "instagram_generate": "modules.instagram.pages.generate",
+    "instagram_history": "modules.instagram.pages.history",
+    "admin_overview": "modules.admin.pages.overview",
+}
+
+
 # -----------------------------
 # Main App
 # -----------------------------
 def main():
+    _warmup_fonts()
+
     # -----------------------------
     # Login UI (ENTRY POINT)
     # -----------------------------
@@ -53,7 +81,9 @@ def main():
     )
 
     user_email = current_user_email()
-    assert user_email is not None
+    if user_email is None:
+        # login_gate가 이미 st.stop()을 호출하지만, -O 실행에서도 안전하게 중단
+        st.stop()
 
     # -----------------------------
     # Navbar
@@ -63,28 +93,17 @@ def main():
     # -----------------------------
     # Page Routing
     # -----------------------------
-    if selected == "instagram_generate":
-        from modules.instagram.pages.generate import run
-
-        run()
-
-    elif selected == "instagram_history":
-        from modules.instagram.pages.history import run
+    mod_name = _ROUTES.get(selected)
+    if mod_name:
+        importlib.import_module(mod_name).run()
+        return
 
-        run()
+    # Home
+    st.title("🏠 Ad Creator Platform")
+    st.caption("소상공인을 위한 AI 광고 콘텐츠 생성 서비스")
 
-    elif selected == "admin_overview":
-        from modules.admin.pages.overview import run
-
-        run()
-
-    else:
-        # Home
-        st.title("🏠 Ad Creator Platform")
-        st.caption("소상공인을 위한 AI 광고 콘텐츠 생성 서비스")
-
-        st.markdown(
-            f"""
+    st.markdown(
+        f"""
 ### 👋 환영합니다!
 **{user_email}** 님,
 
@@ -100,7 +119,7 @@ def main():
 - 전체 사용자 및 광고 생성 현황 확인
 - 시스템 로그 모니터링
 """
-        )
+    )
 
 
 # -----------------------------
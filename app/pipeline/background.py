@@ -22,13 +22,24 @@ from dataclasses import dataclass
 from typing import Optional, Literal, Tuple
 
 import random
-from PIL import Image, ImageDraw
+import re
+
+import numpy as np
+from PIL import Image
 
 
 Backend = Literal["fallback"]  # 추후: "flux" | "sd" | "openai" 등
 
+# 텍스트 유도 토큰 (import 시 1회 컴파일, 단일 패스 탐색)
+_BLACKLIST_RE = re.compile(
+    "|".join(
+        map(re.escape, ["text", "logo", "watermark", "글자", "문구", "텍스트", "로고"])
+    ),
+    re.IGNORECASE,
+)
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BackgroundConfig:
     backend: Backend = "fallback"
     size: Tuple[int, int] = (1080, 1080)
@@ -84,8 +95,6 @@ def _generate_fallback_background(
     - 실제 Flux/SD 연결 전 테스트 및 파이프라인 검증용
     """
     w, h = size
-    img = Image.new("RGB", (w, h), (240, 240, 240))
-    draw = ImageDraw.Draw(img)
 
     # 프롬프트에서 톤 힌트 추출 (아주 단순)
     prompt_l = prompt.lower()
@@ -102,15 +111,14 @@ def _generate_fallback_background(
         else (base_colors[0], base_colors[0])
     )
 
-    # 수직 그라데이션
-    for y in range(h):
-        t = y / max(1, h - 1)
-        r = int(c1[0] * (1 - t) + c2[0] * t)
-        g = int(c1[1] * (1 - t) + c2[1] * t)
-        b = int(c1[2] * (1 - t) + c2[2] * t)
-        draw.line([(0, y), (w, y)], fill=(r, g, b))
+    # 수직 그라데이션: 행 단위 색(h,3)을 한 번에 보간한 뒤 가로로 broadcast
+    t = np.linspace(0.0, 1.0, h)[:, None]  # (h,1)
+    top = np.asarray(c1, dtype=np.float64)
+    bottom = np.asarray(c2, dtype=np.float64)
+    rows = (top * (1 - t) + bottom * t).astype(np.uint8)  # (h,3), int() 절삭과 동일
+    arr = np.broadcast_to(rows[:, None, :], (h, w, 3)).copy()
 
-    return img
+    return Image.fromarray(arr, "RGB")
 
 
 # -----------------------------
@@ -121,11 +129,9 @@ def _assert_prompt_safe(prompt: str) -> None:
     배경 프롬프트 안전 검사:
     - 텍스트/로고/워터마크 요청이 있으면 차단
     """
-    blacklist = ["text", "logo", "watermark", "글자", "문구", "텍스트", "로고"]
-    low = prompt.lower()
-    for b in blacklist:
-        if b in low:
-            raise ValueError(
-                f"Background prompt contains forbidden token '{b}'. "
-                "Text must be added only in render stage."
-            )
+    m = _BLACKLIST_RE.search(prompt)
+    if m:
+        raise ValueError(
+            f"Background prompt contains forbidden token '{m.group(0).lower()}'. "
+            "Text must be added only in render stage."
+        )
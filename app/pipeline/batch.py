@@ -0,0 +1,98 @@
+# ad_creator_platform/pipeline/batch.py
+"""
+Batch Stage Runner (segment → relight → upscale)
+
+역할:
+- 여러 장의 제품 이미지를 같은 설정으로 한 번에 처리한다.
+- 이미지 1장당 파이프라인 1개를 스레드 풀의 워커가 맡는다.
+
+참고:
+- PIL / NumPy는 C 커널(resize, blur, ufunc) 실행 중 GIL을 놓으므로
+  스레드만으로도 코어 수에 비례해 처리량이 늘어난다.
+- ProcessPoolExecutor는 이미지가 pickle 복사되므로 사용하지 않는다.
+- 배경 이미지는 워커 간 읽기 전용으로 공유한다 (relight가 복사본에 합성).
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from PIL import Image
+
+from app.pipeline.segment import segment_product, SegmentConfig
+from app.pipeline.relight import relight_and_compose, RelightConfig
+from app.pipeline.upscale import upscale_image, UpscaleConfig
+
+
+@dataclass
+class BatchConfig:
+    segment: SegmentConfig = field(default_factory=SegmentConfig)
+    relight: RelightConfig = field(default_factory=RelightConfig)
+    upscale: UpscaleConfig = field(default_factory=UpscaleConfig)
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+def run_pipeline_batch(
+    *,
+    images: List[Image.Image],
+    background: Image.Image,
+    config: Optional[BatchConfig] = None,
+    max_workers: Optional[int] = None,
+) -> List[Image.Image]:
+    """
+    제품 이미지 여러 장을 segment → relight → upscale 순으로 병렬 처리한다.
+
+    Args:
+        images: 제품 이미지 리스트 (RGB/RGBA)
+        background: 모든 이미지에 공통으로 쓰는 배경 (RGB)
+        config: 단계별 설정 (모든 이미지에 공통 적용)
+        max_workers: 스레드 수 (기본: os.cpu_count())
+
+    Returns:
+        composed_images: 입력 순서와 동일한 PIL Image 리스트
+    """
+    cfg = config or BatchConfig()
+
+    if not images:
+        return []
+
+    # 단일 이미지는 스레드 풀 생성 비용 없이 바로 처리
+    if len(images) == 1:
+        return [_run_one(image=images[0], background=background, cfg=cfg)]
+
+    # 지연 디코딩된 배경을 워커들이 동시에 load()하지 않도록 미리 디코딩
+    background.load()
+
+    workers = min(max_workers or os.cpu_count() or 1, len(images))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_run_one, image=img, background=background, cfg=cfg)
+            for img in images
+        ]
+        return [f.result() for f in futures]
+
+
+# -----------------------------
+# Helpers
+# -----------------------------
+def _run_one(
+    *,
+    image: Image.Image,
+    background: Image.Image,
+    cfg: BatchConfig,
+) -> Image.Image:
+    """
+    이미지 1장에 대한 segment → relight → upscale
+    """
+    fg_rgba = segment_product(image=image, config=cfg.segment)
+    composed = relight_and_compose(
+        background=background,
+        foreground_rgba=fg_rgba,
+        config=cfg.relight,
+    )
+    return upscale_image(image=composed, config=cfg.upscale)
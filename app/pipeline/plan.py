@@ -18,33 +18,123 @@ Plan Stage (LLM Orchestrator)
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Literal
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Literal
 import json
 import re
 
+try:  # 선택 의존성: 설치되어 있으면 C 구현 직렬화 사용
+    import orjson
+except ImportError:
+    orjson = None
+
 
 Tone = Literal["캐주얼", "고급", "감성"]
 
 
+# -----------------------------
+# Constants (import 시 1회 컴파일)
+# -----------------------------
+# 텍스트 유도 토큰: N번의 부분 문자열 검사 대신 단일 패턴 1회 탐색
+_BLACKLIST_RE = re.compile(
+    "|".join(
+        map(re.escape, ["text", "logo", "watermark", "문구", "글자", "텍스트", "로고"])
+    ),
+    re.IGNORECASE,
+)
+_PERCENT_RE = re.compile(r"(\d+\s?%|\d+\s?퍼센트)")
+_MUST_HAVE = ("no text", "no logo", "no watermark")
+
+# 톤별 규칙 테이블 (목록에 없는 톤은 "캐주얼"로 처리)
+_DEFAULT_TONE = "캐주얼"
+
+# tone → (subcopy 템플릿, cta)
+_COPY_TEMPLATES: Dict[str, tuple[str, str]] = {
+    "고급": ("{p}의 깊은 매력을 프리미엄 무드로.", "지금 예약하기"),
+    "감성": ("따뜻한 순간, {p}와 함께.", "지금 확인하기"),
+    "캐주얼": ("가볍게 즐기는 {p}, 오늘도 부담 없이!", "바로 보기"),
+}
+
+_BG_PROMPT_BASE = ", ".join(
+    [
+        "high quality background for advertisement",
+        "instagram-friendly composition",
+        "soft depth of field",
+        "clean scene",
+        *_MUST_HAVE,
+    ]
+)
+
+_BG_PROMPT_TONE_TOKENS: Dict[str, tuple[str, ...]] = {
+    "고급": (
+        "luxury cafe mood",
+        "premium interior",
+        "warm but elegant lighting",
+        "wood texture",
+    ),
+    "감성": (
+        "warm cozy cafe mood",
+        "soft warm lighting",
+        "wooden table",
+        "gentle bokeh",
+    ),
+    "캐주얼": (
+        "bright friendly cafe mood",
+        "natural lighting",
+        "wooden table",
+        "simple clean",
+    ),
+}
+
+# tone → 완성된 정적 prefix (base + tone 토큰), import 시 1회 join
+_BG_PROMPT_PREFIX: Dict[str, str] = {
+    tone: ", ".join([_BG_PROMPT_BASE, *tokens])
+    for tone, tokens in _BG_PROMPT_TONE_TOKENS.items()
+}
+
+_HEADLINE_FONT_SIZE: Dict[str, str] = {"고급": "lg"}
+
+# LLM layout 값 검증용 허용 집합 (호출마다 list를 새로 만들지 않음)
+_POSITIONS = frozenset(
+    {
+        "upper_center",
+        "upper_left",
+        "upper_right",
+        "center",
+        "lower_center",
+        "lower_left",
+        "lower_right",
+    }
+)
+_FONT_STYLES = frozenset({"regular", "bold"})
+_FONT_SIZES = frozenset({"sm", "md", "lg", "xl"})
+
+
 # -----------------------------
 # Data Models
 # -----------------------------
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CopySpec:
     headline: str
     subcopy: str
     cta: str
 
+    def to_dict(self) -> Dict:
+        return {"headline": self.headline, "subcopy": self.subcopy, "cta": self.cta}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class EmphasisSpec:
     text: str
     color_hex: str = "#FF4D4D"  # 강조 색 (기본: 레드 계열)
     scale: float = 1.15  # 강조 크기 배율(렌더러에서 해석)
 
+    def to_dict(self) -> Dict:
+        return {"text": self.text, "color_hex": self.color_hex, "scale": self.scale}
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TextBlockLayout:
     position: Literal[
         "upper_center",
@@ -60,15 +150,31 @@ class TextBlockLayout:
     color_hex: str = "#FFFFFF"
     emphasis: Optional[EmphasisSpec] = None
 
+    def to_dict(self) -> Dict:
+        return {
+            "position": self.position,
+            "font_style": self.font_style,
+            "font_size": self.font_size,
+            "color_hex": self.color_hex,
+            "emphasis": self.emphasis.to_dict() if self.emphasis else None,
+        }
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LayoutSpec:
     headline: TextBlockLayout
     subcopy: TextBlockLayout
     cta: TextBlockLayout
 
+    def to_dict(self) -> Dict:
+        return {
+            "headline": self.headline.to_dict(),
+            "subcopy": self.subcopy.to_dict(),
+            "cta": self.cta.to_dict(),
+        }
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelHints:
     # 배경 스타일 고정을 위한 LoRA 이름/키 (지금은 미사용, 훅만)
     lora_key: Optional[str] = None
@@ -77,8 +183,15 @@ class ModelHints:
     # IP-Adapter 사용 시 레퍼런스 이미지 key/path (지금은 미사용)
     ip_adapter_ref: Optional[str] = None
 
+    def to_dict(self) -> Dict:
+        return {
+            "lora_key": self.lora_key,
+            "control_hint": self.control_hint,
+            "ip_adapter_ref": self.ip_adapter_ref,
+        }
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Plan:
     copy: CopySpec
     background_prompt: str
@@ -86,7 +199,40 @@ class Plan:
     model_hints: ModelHints
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # 구조가 고정되어 있으므로 asdict()의 재귀 deepcopy 없이 직접 구성
+        return {
+            "copy": self.copy.to_dict(),
+            "background_prompt": self.background_prompt,
+            "layout": self.layout.to_dict(),
+            "model_hints": self.model_hints.to_dict(),
+        }
+
+    def to_json(self) -> bytes:
+        """
+        이력 저장용 JSON(UTF-8 bytes).
+        - to_dict() + json.dumps 두 번 순회 대신 직렬화 한 번에 처리
+        """
+        if orjson is not None:
+            return orjson.dumps(self, default=_plan_default)
+        return json.dumps(
+            self,
+            default=_plan_default,
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+
+_PLAN_TYPES = (CopySpec, EmphasisSpec, TextBlockLayout, LayoutSpec, ModelHints, Plan)
+
+
+def _plan_default(o):
+    """
+    json/orjson default 훅: Plan 계열 dataclass를 얕은 dict로 변환
+    (하위 dataclass는 직렬화기가 다시 이 훅을 호출하며 처리)
+    """
+    if isinstance(o, _PLAN_TYPES):
+        return {name: getattr(o, name) for name in o.__slots__}
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
 
 
 # -----------------------------
@@ -100,6 +246,8 @@ def build_plan(
     prompt_extra: Optional[str] = None,
     # LLM 결과를 붙일 수 있도록 확장 포인트
     llm_json: Optional[Dict] = None,
+    # False면 규칙 기반 Plan 캐시를 거치지 않고 매번 새로 생성
+    use_cache: bool = True,
 ) -> Plan:
     """
     Plan을 생성한다.
@@ -118,6 +266,46 @@ def build_plan(
     discount = (discount or "").strip() or None
     prompt_extra = (prompt_extra or "").strip() or None
 
+    # 1~4) 규칙 기반 Plan (입력이 같으면 캐시된 불변 Plan 재사용)
+    build_rule = _build_plan_rule if use_cache else _build_plan_rule.__wrapped__
+    plan = build_rule(
+        product=product,
+        tone=tone,
+        discount=discount,
+        prompt_extra=prompt_extra,
+    )
+
+    # LLM 결과가 있다면 merge (캐시 우회)
+    if llm_json:
+        copy, bg_prompt, layout, hints = _merge_llm_json(
+            llm_json=llm_json,
+            base_copy=plan.copy,
+            base_bg_prompt=plan.background_prompt,
+            base_layout=plan.layout,
+            base_hints=plan.model_hints,
+        )
+        return Plan(
+            copy=copy,
+            background_prompt=bg_prompt,
+            layout=layout,
+            model_hints=hints,
+        )
+
+    return plan
+
+
+@lru_cache(maxsize=256)
+def _build_plan_rule(
+    *,
+    product: str,
+    tone: Tone,
+    discount: Optional[str],
+    prompt_extra: Optional[str],
+) -> Plan:
+    """
+    규칙 기반 Plan 생성 (입력에 대해 결정적).
+    - Plan은 frozen dataclass이므로 캐시된 인스턴스를 그대로 공유해도 안전
+    """
     # 1) Copy
     copy = _build_copy_rule(product=product, tone=tone, discount=discount)
 
@@ -142,16 +330,6 @@ def build_plan(
         ip_adapter_ref=None,
     )
 
-    # LLM 결과가 있다면 merge
-    if llm_json:
-        copy, bg_prompt, layout, hints = _merge_llm_json(
-            llm_json=llm_json,
-            base_copy=copy,
-            base_bg_prompt=bg_prompt,
-            base_layout=layout,
-            base_hints=hints,
-        )
-
     return Plan(
         copy=copy,
         background_prompt=bg_prompt,
@@ -175,20 +353,14 @@ def _build_copy_rule(*, product: str, tone: Tone, discount: Optional[str]) -> Co
     else:
         headline = f"{product} 지금 만나보세요"
 
-    # Subcopy
-    if tone == "고급":
-        subcopy = f"{product}의 깊은 매력을 프리미엄 무드로."
-        cta = "지금 예약하기"
-    elif tone == "감성":
-        subcopy = f"따뜻한 순간, {product}와 함께."
-        cta = "지금 확인하기"
-    else:
-        subcopy = f"가볍게 즐기는 {product}, 오늘도 부담 없이!"
-        cta = "바로 보기"
+    # Subcopy / CTA
+    subcopy_tpl, cta = _COPY_TEMPLATES.get(tone, _COPY_TEMPLATES[_DEFAULT_TONE])
+    subcopy = subcopy_tpl.format(p=product)
 
     return CopySpec(headline=headline, subcopy=subcopy, cta=cta)
 
 
+@lru_cache(maxsize=256)
 def _build_background_prompt_rule(
     *, product: str, tone: Tone, extra: Optional[str]
 ) -> str:
@@ -196,48 +368,20 @@ def _build_background_prompt_rule(
     배경 생성 프롬프트 규칙.
     - 절대 텍스트 넣지 않음
     """
-    base = [
-        "high quality background for advertisement",
-        "instagram-friendly composition",
-        "soft depth of field",
-        "clean scene",
-        "no text",
-        "no logo",
-        "no watermark",
+    # base + tone 토큰은 import 시 미리 join된 prefix 사용
+    parts = [
+        _BG_PROMPT_PREFIX.get(tone, _BG_PROMPT_PREFIX[_DEFAULT_TONE]),
+        # product는 분위기만 힌트로(직접 텍스트 렌더링 X)
+        f"fits well with {product}",
     ]
 
-    if tone == "고급":
-        base += [
-            "luxury cafe mood",
-            "premium interior",
-            "warm but elegant lighting",
-            "wood texture",
-        ]
-    elif tone == "감성":
-        base += [
-            "warm cozy cafe mood",
-            "soft warm lighting",
-            "wooden table",
-            "gentle bokeh",
-        ]
-    else:
-        base += [
-            "bright friendly cafe mood",
-            "natural lighting",
-            "wooden table",
-            "simple clean",
-        ]
-
-    # product는 분위기만 힌트로(직접 텍스트 렌더링 X)
-    base.append(f"fits well with {product}")
-
     if extra:
         # extra에 "텍스트"가 들어오면 제거(안전장치)
         safe_extra = _strip_text_like_tokens(extra)
         if safe_extra:
-            base.append(safe_extra)
+            parts.append(safe_extra)
 
-    return ", ".join(base)
+    return ", ".join(parts)
 
 
 def _build_layout_rule(
@@ -259,7 +403,7 @@ def _build_layout_rule(
     headline_layout = TextBlockLayout(
         position="upper_center",
         font_style="bold",
-        font_size="xl" if tone != "고급" else "lg",
+        font_size=_HEADLINE_FONT_SIZE.get(tone, "xl"),
         color_hex="#FFFFFF",
         emphasis=emphasis,
     )
@@ -309,12 +453,13 @@ def _merge_llm_json(
     hints = base_hints
 
     # copy
-    c = llm_json.get("copy")
-    if isinstance(c, dict):
-        headline = str(c.get("headline") or copy.headline)
-        subcopy = str(c.get("subcopy") or copy.subcopy)
-        cta = str(c.get("cta") or copy.cta)
-        copy = CopySpec(headline=headline, subcopy=subcopy, cta=cta)
+    c = _as_dict(llm_json.get("copy"))
+    if c:
+        copy = CopySpec(
+            headline=_get_str(c, "headline", copy.headline),
+            subcopy=_get_str(c, "subcopy", copy.subcopy),
+            cta=_get_str(c, "cta", copy.cta),
+        )
 
     # background_prompt
     bp = llm_json.get("background_prompt")
@@ -322,13 +467,13 @@ def _merge_llm_json(
         bg_prompt = _enforce_bg_prompt_safety(bp.strip())
 
     # layout
-    l = llm_json.get("layout")
-    if isinstance(l, dict):
+    l = _as_dict(llm_json.get("layout"))
+    if l:
         layout = _parse_layout_dict(l, fallback=layout)
 
     # model hints
-    mh = llm_json.get("model_hints")
-    if isinstance(mh, dict):
+    mh = _as_dict(llm_json.get("model_hints"))
+    if mh:
         hints = ModelHints(
             lora_key=_safe_str(mh.get("lora_key"), hints.lora_key),
             control_hint=_safe_str(mh.get("control_hint"), hints.control_hint),
@@ -345,39 +490,32 @@ def _parse_layout_dict(d: Dict, fallback: LayoutSpec) -> LayoutSpec:
             return fb
 
         emphasis = None
-        em = x.get("emphasis")
-        if isinstance(em, dict) and em.get("text"):
+        em = _as_dict(x.get("emphasis"))
+        em_text = _get_str(em, "text", "")
+        if em_text:
             emphasis = EmphasisSpec(
-                text=str(em.get("text")),
-                color_hex=str(em.get("color_hex") or "#FF4D4D"),
+                text=em_text,
+                color_hex=_get_str(em, "color_hex", "#FF4D4D"),
                 scale=float(em.get("scale") or 1.15),
             )
 
         return TextBlockLayout(
             position=_safe_literal(
                 x.get("position"),
-                allowed=[
-                    "upper_center",
-                    "upper_left",
-                    "upper_right",
-                    "center",
-                    "lower_center",
-                    "lower_left",
-                    "lower_right",
-                ],
+                allowed=_POSITIONS,
                 default=fb.position,
             ),
             font_style=_safe_literal(
                 x.get("font_style"),
-                allowed=["regular", "bold"],
+                allowed=_FONT_STYLES,
                 default=fb.font_style,
             ),
             font_size=_safe_literal(
                 x.get("font_size"),
-                allowed=["sm", "md", "lg", "xl"],
+                allowed=_FONT_SIZES,
                 default=fb.font_size,
             ),
-            color_hex=str(x.get("color_hex") or fb.color_hex),
+            color_hex=_get_str(x, "color_hex", fb.color_hex),
             emphasis=emphasis,
         )
 
@@ -394,14 +532,13 @@ def _parse_layout_dict(d: Dict, fallback: LayoutSpec) -> LayoutSpec:
 def _enforce_bg_prompt_safety(prompt: str) -> str:
     """
     배경 프롬프트에 'no text/no logo/no watermark'를 강제로 포함한다.
+    - 프롬프트를 ',' 단위 토큰 집합으로 한 번만 분해해 누락 토큰을 찾는다
     """
-    must_have = ["no text", "no logo", "no watermark"]
-    lower = prompt.lower()
-    parts = [prompt]
-    for token in must_have:
-        if token not in lower:
-            parts.append(token)
-    return ", ".join(parts)
+    tokens = {t.strip() for t in prompt.lower().split(",")}
+    missing = [m for m in _MUST_HAVE if m not in tokens]
+    if not missing:
+        return prompt
+    return ", ".join([prompt, *missing])
 
 
 def _strip_text_like_tokens(s: str) -> str:
@@ -409,8 +546,7 @@ def _strip_text_like_tokens(s: str) -> str:
     사용자 extra 요청에 '텍스트 넣기' 등의 위험 신호가 있으면 제거한다.
     """
     # 아주 단순한 안전 필터 (필요 시 강화)
-    blacklist = ["text", "logo", "watermark", "문구", "글자", "텍스트", "로고"]
-    if any(b.lower() in s.lower() for b in blacklist):
+    if _BLACKLIST_RE.search(s):
         return ""
     return s.strip()
 
@@ -419,12 +555,24 @@ def _extract_percent_or_number_phrase(text: str) -> Optional[str]:
     """
     '50%' 같은 강조 타겟을 추출
     """
-    m = re.search(r"(\d+\s?%|\d+\s?퍼센트)", text)
+    m = _PERCENT_RE.search(text)
     if m:
         return m.group(1).replace(" ", "")
     return None
 
 
+def _as_dict(x) -> Dict:
+    return x if isinstance(x, dict) else {}
+
+
+def _get_str(d: Dict, key: str, default: str) -> str:
+    """
+    d[key]가 비어 있지 않은 문자열일 때만 사용, 그 외(None/""/숫자/list 등)는 default
+    """
+    v = d.get(key)
+    return v if isinstance(v, str) and v else default
+
+
 def _safe_str(v, default: Optional[str]) -> Optional[str]:
     if v is None:
         return default
@@ -432,7 +580,6 @@ def _safe_str(v, default: Optional[str]) -> Optional[str]:
     return s if s else default
 
 
-def _safe_literal(v, allowed: List[str], default: str) -> str:
-    if v in allowed:
-        return v
-    return default
+def _safe_literal(v, allowed: frozenset[str], default: str) -> str:
+    # LLM JSON이 list/dict 등 unhashable 값을 줄 수 있으므로 str만 조회
+    return v if isinstance(v, str) and v in allowed else default
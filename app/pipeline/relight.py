@@ -21,6 +21,7 @@ Relight Stage (Lighting & Shadow Composition)
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Literal, Tuple
 
 import numpy as np
@@ -29,8 +30,11 @@ from PIL import Image, ImageFilter, ImageEnhance
 
 Backend = Literal["fallback"]  # 추후: "ic_light"
 
+# 그림자 블러를 수행할 축소 배율
+_SHADOW_DOWNSAMPLE = 4
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class RelightConfig:
     backend: Backend = "fallback"
 
@@ -87,8 +91,9 @@ def _relight_fallback(
     - 배경 중앙 밝기를 기준으로 전경 밝기 약간 보정
     - 전경 아래쪽에 소프트 그림자 추가
     """
-    bg = background.convert("RGB")
-    fg = fg.convert("RGBA")
+    # 같은 모드의 convert()도 전체 복사이므로 필요할 때만 변환
+    bg = background if background.mode == "RGB" else background.convert("RGB")
+    fg = fg if fg.mode == "RGBA" else fg.convert("RGBA")
 
     bg_w, bg_h = bg.size
     fg_w, fg_h = fg.size
@@ -96,7 +101,7 @@ def _relight_fallback(
     # 1) 전경 크기 조정 (배경의 약 60%)
     scale = min(bg_w / fg_w, bg_h / fg_h) * 0.6
     new_size = (int(fg_w * scale), int(fg_h * scale))
-    fg = fg.resize(new_size, Image.LANCZOS)
+    fg = fg.resize(new_size, Image.Resampling.LANCZOS)
 
     # 2) 전경 위치 (하단 중앙 살짝 위)
     x = (bg_w - fg.width) // 2
@@ -111,10 +116,10 @@ def _relight_fallback(
     )
 
     canvas = bg.copy()
-    canvas.paste(
-        shadow,
-        (x + cfg.shadow_offset[0], y + cfg.shadow_offset[1]),
-        shadow,
+    _apply_shadow(
+        canvas=canvas,
+        shadow_alpha=shadow,
+        pos=(x + cfg.shadow_offset[0], y + cfg.shadow_offset[1]),
     )
 
     # 4) 전경 톤 보정 (배경 밝기 반영)
@@ -125,7 +130,11 @@ def _relight_fallback(
     )
 
     # 5) 전경 합성
-    canvas.paste(fg, (x, y), fg)
+    # 전경 bbox만 RGBA로 올려 alpha_composite (전체 캔버스 RGBA 변환 없음)
+    box = (x, y, x + fg.width, y + fg.height)
+    region = canvas.crop(box).convert("RGBA")
+    region.alpha_composite(fg)
+    canvas.paste(region.convert("RGB"), box[:2])
 
     return canvas
 
@@ -142,26 +151,66 @@ def _make_shadow(
 ) -> Image.Image:
     """
     전경 알파를 기반으로 소프트 그림자 생성
-    """
-    # 알파 채널만 추출
-    alpha = fg.split()[-1]
 
-    shadow = Image.new("RGBA", fg.size, (0, 0, 0, 0))
-    shadow.putalpha(alpha)
+    Returns:
+        그림자 알파 마스크 (L). 그림자 색은 항상 검정이므로 RGB 채널은 만들지 않는다.
+    """
+    # 알파 채널만 추출 (그림자는 알파만 필요)
+    alpha = fg.getchannel("A")
+    w, h = fg.size
 
-    # 검은색으로 채움
-    shadow = ImageEnhance.Brightness(shadow).enhance(0.0)
+    # 그림자는 저주파 → 1/4로 축소한 알파에서 블러 후 원래 크기로 복원
+    # (블러 비용 ~ 픽셀 수 × 반경 이므로 축소 배율만큼 크게 감소)
+    f = _SHADOW_DOWNSAMPLE
+    small = alpha.resize((max(1, w // f), max(1, h // f)), Image.Resampling.BILINEAR)
 
-    # 투명도 적용
-    shadow_alpha = shadow.split()[-1]
-    shadow_alpha = shadow_alpha.point(lambda p: int(p * opacity))
-    shadow.putalpha(shadow_alpha)
+    # 투명도 적용 (256-entry LUT, Python 콜백 호출 없음)
+    small = small.point(_opacity_lut(opacity))
 
     # 블러
     if blur > 0:
-        shadow = shadow.filter(ImageFilter.GaussianBlur(radius=blur))
+        small = small.filter(ImageFilter.GaussianBlur(radius=blur / f))
 
-    return shadow
+    return small.resize((w, h), Image.Resampling.BILINEAR)
+
+
+def _apply_shadow(
+    *,
+    canvas: Image.Image,
+    shadow_alpha: Image.Image,
+    pos: Tuple[int, int],
+) -> None:
+    """
+    검은 그림자를 canvas(RGB)에 제자리 합성한다.
+
+    - 검정과의 알파 블렌딩은 canvas * (255 - a) / 255 로 정리되므로
+      paste(mask) 범용 경로 대신 그림자 bbox 영역만 정수 연산으로 처리
+    - canvas 밖으로 벗어난 부분은 잘라낸다
+    """
+    cw, ch = canvas.size
+    sw, sh = shadow_alpha.size
+    x0, y0 = max(pos[0], 0), max(pos[1], 0)
+    x1, y1 = min(pos[0] + sw, cw), min(pos[1] + sh, ch)
+    if x0 >= x1 or y0 >= y1:
+        return
+
+    a = np.asarray(
+        shadow_alpha.crop((x0 - pos[0], y0 - pos[1], x1 - pos[0], y1 - pos[1])),
+        dtype=np.uint16,
+    )
+    roi = np.asarray(canvas.crop((x0, y0, x1, y1)), dtype=np.uint16)
+
+    # uint16 범위 내 정수 연산 (255 * 255 + 127 < 65536), 반올림 포함
+    roi = (roi * (255 - a)[..., None] + 127) // 255
+    canvas.paste(Image.fromarray(roi.astype(np.uint8)), (x0, y0))
+
+
+@lru_cache(maxsize=16)
+def _opacity_lut(opacity: float) -> tuple[int, ...]:
+    """
+    알파 × opacity 변환용 LUT (opacity 별 1회 생성)
+    """
+    return tuple(int(i * opacity) for i in range(256))
 
 
 def _tone_match_foreground(
@@ -174,10 +223,13 @@ def _tone_match_foreground(
     배경 평균 밝기를 기준으로 전경 밝기를 살짝 맞춘다.
     """
     # 배경 중앙 영역 평균 밝기
-    bg_arr = np.asarray(background).astype("float32")
-    h, w = bg_arr.shape[:2]
-    center = bg_arr[int(h * 0.4) : int(h * 0.6), int(w * 0.4) : int(w * 0.6)]
-    bg_lum = center.mean() / 255.0
+    # (np.asarray(PIL)은 전체 픽셀을 복사하므로, PIL에서 중앙만 crop한 뒤 배열화
+    #  → 전체 배경 대신 중앙 4% 영역만 복사, float32 누적)
+    w, h = background.size
+    center = np.asarray(
+        background.crop((int(w * 0.4), int(h * 0.4), int(w * 0.6), int(h * 0.6)))
+    )
+    bg_lum = float(center.mean(dtype=np.float32)) / 255.0
 
     # 전경 밝기 보정
     enhancer = ImageEnhance.Brightness(fg)
@@ -25,11 +25,16 @@ from typing import Optional, Literal
 import numpy as np
 from PIL import Image, ImageFilter
 
+try:  # 선택 의존성: 설치되어 있으면 마스크 커널을 JIT 컴파일
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None
+
 
 SegmentBackend = Literal["fallback"]  # 추후: "birefnet" | "sam" | "u2net" 등으로 확장
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SegmentConfig:
     backend: SegmentBackend = "fallback"
     # 폴백 품질 파라미터
@@ -80,33 +85,31 @@ def _segment_fallback(*, image: Image.Image, cfg: SegmentConfig) -> Image.Image:
     - 실무에서는 BiRefNet/SAM 등으로 교체 권장
     """
     img = image.convert("RGB")
-    arr = np.array(img).astype(np.int16)
+    arr = np.asarray(img)  # uint8 그대로 (전체 이미지 캐스팅 없음)
     h, w = arr.shape[:2]
 
     # 1) 배경 색상 추정: 이미지 가장자리(border) 픽셀의 평균
+    #    (4개 띠를 이어붙이지 않고 띠별 합계를 누적 → 임시 배열 없음)
     b = max(4, int(cfg.bg_sample_border))
-    border_pixels = np.concatenate(
-        [
-            arr[:b, :, :].reshape(-1, 3),
-            arr[-b:, :, :].reshape(-1, 3),
-            arr[:, :b, :].reshape(-1, 3),
-            arr[:, -b:, :].reshape(-1, 3),
-        ],
-        axis=0,
-    )
-    bg_color = border_pixels.mean(axis=0)  # (3,)
+    strips = (arr[:b], arr[-b:], arr[:, :b], arr[:, -b:])
+    total = sum(s.sum(axis=(0, 1), dtype=np.int64) for s in strips)
+    count = sum(s.shape[0] * s.shape[1] for s in strips)
+    bg_color = total / count  # (3,)
 
     # 2) 색 거리 기반 마스크
-    dist = np.sqrt(((arr - bg_color) ** 2).sum(axis=2))  # (h,w)
+    bg_color = bg_color.astype(np.float32)
     # 임계값: 배경/전경 대비가 약하면 오동작 가능 -> 중앙 영역을 이용해 보정
-    center = _center_box(h=h, w=w, margin=cfg.fg_center_margin)
-    center_dist = dist[center[0] : center[1], center[2] : center[3]]
+    #    (중앙 슬라이스만 거리 계산 → 전체 거리 배열 없이 평균을 먼저 구함)
+    top, bottom, left, right = _center_box(h=h, w=w, margin=cfg.fg_center_margin)
+    center_diff = arr[top:bottom, left:right].astype(np.float32) - bg_color
+    center_dist = np.sqrt(np.einsum("hwc,hwc->hw", center_diff, center_diff))
     # 중앙 영역에서 거리 평균이 높을수록 전경이 더 "배경과 다르다"
-    center_mean = float(center_dist.mean())
+    center_mean = float(center_dist.mean()) if center_dist.size else 0.0
     # 동적 임계값: 중앙 평균의 일부 + 최소값
     thr = max(18.0, center_mean * 0.55)
 
-    mask = (dist > thr).astype(np.uint8) * 255  # 0 or 255
+    #    제곱 거리만 계산(전체 sqrt 생략), 임계값도 제곱해서 비교
+    mask = _threshold_mask(arr, bg_color, thr * thr)  # 0 or 255
 
     # 3) 마스크 후처리(가장자리 부드럽게)
     mask_img = Image.fromarray(mask, mode="L")
@@ -126,6 +129,40 @@ def _segment_fallback(*, image: Image.Image, cfg: SegmentConfig) -> Image.Image:
     return out
 
 
+def _threshold_mask(arr: np.ndarray, bg_color: np.ndarray, thr2: float) -> np.ndarray:
+    """
+    배경색과의 제곱 거리가 thr2를 넘는 픽셀만 255인 (h,w) uint8 마스크
+    - numba가 있으면 한 번의 패스로 거리+비교를 처리하는 커널 사용
+    - 없으면 numpy 경로 (diff → einsum → where)
+    """
+    if _seg_kernel is not None:
+        return _seg_kernel(
+            arr, float(bg_color[0]), float(bg_color[1]), float(bg_color[2]), float(thr2)
+        )
+
+    diff = arr.astype(np.float32) - bg_color
+    dist2 = np.einsum("hwc,hwc->hw", diff, diff)  # (h,w)
+    return np.where(dist2 > thr2, np.uint8(255), np.uint8(0))
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _seg_kernel(arr, bg_r, bg_g, bg_b, thr2):
+        h, w, _ = arr.shape
+        out = np.empty((h, w), np.uint8)
+        for y in prange(h):
+            for x in range(w):
+                dr = arr[y, x, 0] - bg_r
+                dg = arr[y, x, 1] - bg_g
+                db = arr[y, x, 2] - bg_b
+                out[y, x] = 255 if dr * dr + dg * dg + db * db > thr2 else 0
+        return out
+
+else:
+    _seg_kernel = None
+
+
 def _center_box(*, h: int, w: int, margin: float) -> tuple[int, int, int, int]:
     """
     중앙 박스 영역 계산 (전경 추정용)
@@ -18,7 +18,7 @@ Upscale Stage (Super Resolution)
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, Literal, Tuple
+from typing import List, Optional, Literal, Tuple
 
 from PIL import Image
 
@@ -26,7 +26,7 @@ from PIL import Image
 Backend = Literal["fallback"]  # 추후: "realesrgan" | "swinir"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UpscaleConfig:
     backend: Backend = "fallback"
     scale: int = 2  # 2x, 4x 등
@@ -59,6 +59,34 @@ def upscale_image(
     raise NotImplementedError(f"Unsupported upscale backend: {cfg.backend}")
 
 
+def upscale_images(
+    *,
+    images: List[Image.Image],
+    config: Optional[UpscaleConfig] = None,
+) -> List[Image.Image]:
+    """
+    여러 이미지를 한 번에 업스케일한다 (배치 진입점).
+
+    Args:
+        images: 입력 이미지 리스트 (RGB or RGBA)
+        config: 업스케일 설정 (모든 이미지에 공통 적용)
+
+    Returns:
+        upscaled_images: 입력 순서와 동일한 PIL Image 리스트
+
+    모델 백엔드 계약 (realesrgan/swinir 연결 시):
+    - 모델은 프로세스당 1회 로드하고 이 함수 안에서 재사용
+    - 입력을 (N, 3, H, W) 텐서 한 개로 묶어 forward 1회 → N장으로 분리해 반환
+    - 크기가 다른 이미지는 크기별로 그룹을 나눠 배치
+    """
+    cfg = config or UpscaleConfig()
+
+    if cfg.backend == "fallback":
+        return [_upscale_fallback(image=img, cfg=cfg) for img in images]
+
+    raise NotImplementedError(f"Unsupported upscale backend: {cfg.backend}")
+
+
 # -----------------------------
 # Fallback Implementation
 # -----------------------------
@@ -85,4 +113,8 @@ def _upscale_fallback(
         new_w = int(new_w * scale)
         new_h = int(new_h * scale)
 
-    return image.resize((new_w, new_h), Image.LANCZOS)
+    # 크기 변화가 없으면 리사이즈 생략 (scale=1 또는 max_size로 1.0배가 된 경우)
+    if (new_w, new_h) == image.size:
+        return image
+
+    return image.resize((new_w, new_h), Image.Resampling.LANCZOS)
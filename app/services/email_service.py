@@ -18,21 +18,35 @@ SMTP_FROM
 from __future__ import annotations
 
 import os
-import smtplib
-from email.message import EmailMessage
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from app.core.config import get_config
+
+if TYPE_CHECKING:
+    import smtplib
+
+# smtplib / email.message는 실제 발송 시점에만 import
+# (대부분의 요청은 메일을 보내지 않으므로 SSL/hash 모듈 체인 로딩을 cold start에서 제외)
 
 
 # -----------------------------
 # Config Loader
 # -----------------------------
+@lru_cache(maxsize=1)
 def _get_smtp_config() -> dict:
+    """
+    SMTP 설정 (프로세스당 1회 조회, 반환 dict는 읽기 전용으로 사용)
+    """
+    app_cfg = get_config()
     return {
-        "host": os.getenv("SMTP_HOST", ""),
-        "port": int(os.getenv("SMTP_PORT", "587")),
-        "user": os.getenv("SMTP_USER", ""),
+        "host": app_cfg.smtp_host,
+        "port": app_cfg.smtp_port,
+        "user": app_cfg.smtp_user,
+        # 비밀번호는 설정 객체에 보관하지 않고 직접 읽음
         "password": os.getenv("SMTP_PASS", ""),
-        "from_email": os.getenv("SMTP_FROM", ""),
+        "from_email": app_cfg.smtp_from,
     }
 
 
@@ -61,6 +75,8 @@ def send_image_email(
         body_text: 본문 텍스트
         image_path: 첨부할 이미지 경로 (png)
     """
+    from email.message import EmailMessage
+
     cfg = _get_smtp_config()
     _validate_config(cfg)
 
@@ -69,7 +85,7 @@ def send_image_email(
         raise FileNotFoundError(f"이미지 파일이 존재하지 않습니다: {image_path}")
 
     # -----------------------------
-    # Build Email
+    # Build Email (헤더/본문)
     # -----------------------------
     msg = EmailMessage()
     msg["Subject"] = subject
@@ -77,20 +93,37 @@ def send_image_email(
     msg["To"] = to_email
     msg.set_content(body_text)
 
-    with open(image_path, "rb") as f:
-        img_data = f.read()
-
-    msg.add_attachment(
-        img_data,
-        maintype="image",
-        subtype="png",
-        filename=image_path.name,
-    )
-
     # -----------------------------
     # Send
     # -----------------------------
-    with smtplib.SMTP(cfg["host"], cfg["port"]) as server:
-        server.starttls()
-        server.login(cfg["user"], cfg["password"])
+    # 연결/로그인을 먼저 수행: 인증 실패 시 첨부 파일을 읽지 않고,
+    # 인코딩된 첨부가 메모리에 머무는 시간도 전송 구간으로 한정
+    with _open_smtp(cfg) as server:
+        msg.add_attachment(
+            image_path.read_bytes(),  # 원본 bytes는 base64 인코딩 직후 해제됨
+            maintype="image",
+            subtype="png",
+            filename=image_path.name,
+        )
         server.send_message(msg)
+
+
+def _open_smtp(cfg: dict) -> smtplib.SMTP:
+    """
+    SMTP 연결 + 로그인
+    - 465: 암묵적 TLS(SMTP_SSL) → STARTTLS 왕복 1회 생략
+    - 그 외(587 등): STARTTLS
+    """
+    import smtplib
+
+    implicit_tls = cfg["port"] == 465
+    smtp_cls = smtplib.SMTP_SSL if implicit_tls else smtplib.SMTP
+    server = smtp_cls(cfg["host"], cfg["port"])
+    try:
+        if not implicit_tls:
+            server.starttls()
+        server.login(cfg["user"], cfg["password"])
+    except Exception:
+        server.close()
+        raise
+    return server
@@ -14,8 +14,10 @@ Layout Service
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from typing import Dict, Tuple, Literal
+from functools import lru_cache
+from typing import Callable, Dict, Tuple, Literal
 
 
 Position = Literal[
@@ -31,10 +33,43 @@ Position = Literal[
 FontSize = Literal["sm", "md", "lg", "xl"]
 
 
+# -----------------------------
+# Lookup Tables
+# -----------------------------
+# platform → (상단, 하단) 안전 영역 비율
+_SAFE_MARGIN_RATIO: Dict[str, Tuple[float, float]] = {
+    "instagram": (0.10, 0.10),
+    "poster": (0.08, 0.08),
+    "banner": (0.15, 0.15),
+}
+_DEFAULT_SAFE_MARGIN_RATIO: Tuple[float, float] = (0.1, 0.1)
+
+# platform → font_size → px (render_service 폰트 warmup에서도 사용)
+FONT_PX: Dict[str, Dict[str, int]] = {
+    "instagram": {"sm": 36, "md": 52, "lg": 72, "xl": 96},
+    "poster": {"sm": 48, "md": 72, "lg": 96, "xl": 140},
+    "banner": {"sm": 32, "md": 48, "lg": 64, "xl": 88},
+}
+
+# "#RRGGBB"의 RRGGBB 부분 (부호/밑줄 등 int()가 허용하는 형태는 거부)
+_HEX_RGB_RE = re.compile(r"[0-9a-fA-F]{6}")
+
+# position → (w, h, safe_top, safe_bottom) -> (x, y, anchor)
+_POSITION_XY: Dict[str, Callable[[int, int, int, int], Tuple[int, int, str]]] = {
+    "upper_center": lambda w, h, st, sb: (w // 2, st, "ma"),
+    "upper_left": lambda w, h, st, sb: (int(w * 0.08), st, "la"),
+    "upper_right": lambda w, h, st, sb: (int(w * 0.92), st, "ra"),
+    "center": lambda w, h, st, sb: (w // 2, h // 2, "mm"),
+    "lower_center": lambda w, h, st, sb: (w // 2, h - sb, "md"),
+    "lower_left": lambda w, h, st, sb: (int(w * 0.08), h - sb, "ld"),
+    "lower_right": lambda w, h, st, sb: (int(w * 0.92), h - sb, "rd"),
+}
+
+
 # -----------------------------
 # Data Model
 # -----------------------------
-@dataclass
+@dataclass(frozen=True)
 class ResolvedTextLayout:
     x: int
     y: int
@@ -89,7 +124,7 @@ def resolve_text_layout(
         y=y,
         font_px=font_px,
         anchor=anchor,
-        color=_hex_to_rgba(color_hex),
+        color=hex_to_rgba(color_hex),
         emphasis=emphasis,
     )
 
@@ -101,25 +136,15 @@ def _safe_vertical_margins(platform: str, h: int) -> Tuple[int, int]:
     """
     플랫폼별 안전 영역 (텍스트 잘림 방지)
     """
-    if platform == "instagram":
-        return int(h * 0.10), int(h * 0.10)
-    if platform == "poster":
-        return int(h * 0.08), int(h * 0.08)
-    if platform == "banner":
-        return int(h * 0.15), int(h * 0.15)
-    return int(h * 0.1), int(h * 0.1)
+    top, bottom = _SAFE_MARGIN_RATIO.get(platform, _DEFAULT_SAFE_MARGIN_RATIO)
+    return int(h * top), int(h * bottom)
 
 
 def _resolve_font_px(font_size: FontSize, platform: str) -> int:
     """
     추상 font_size → 실제 픽셀
     """
-    base = {
-        "instagram": {"sm": 36, "md": 52, "lg": 72, "xl": 96},
-        "poster": {"sm": 48, "md": 72, "lg": 96, "xl": 140},
-        "banner": {"sm": 32, "md": 48, "lg": 64, "xl": 88},
-    }
-    return base.get(platform, base["instagram"])[font_size]
+    return FONT_PX.get(platform, FONT_PX["instagram"])[font_size]
 
 
 def _resolve_position_xy(
@@ -133,35 +158,22 @@ def _resolve_position_xy(
     """
     position → (x, y, anchor)
     """
-    if position == "upper_center":
-        return w // 2, safe_top, "ma"
-    if position == "upper_left":
-        return int(w * 0.08), safe_top, "la"
-    if position == "upper_right":
-        return int(w * 0.92), safe_top, "ra"
-
-    if position == "center":
-        return w // 2, h // 2, "mm"
+    resolver = _POSITION_XY.get(position, _POSITION_XY["center"])  # fallback: center
+    return resolver(w, h, safe_top, safe_bottom)
 
-    if position == "lower_center":
-        return w // 2, h - safe_bottom, "md"
-    if position == "lower_left":
-        return int(w * 0.08), h - safe_bottom, "ld"
-    if position == "lower_right":
-        return int(w * 0.92), h - safe_bottom, "rd"
 
-    # fallback
-    return w // 2, h // 2, "mm"
-
-
-def _hex_to_rgba(hex_color: str, alpha: int = 255) -> Tuple[int, int, int, int]:
+# -----------------------------
+# Color Utils (render_service 공용)
+# -----------------------------
+@lru_cache(maxsize=256)
+def hex_to_rgba(hex_color: str, alpha: int = 255) -> Tuple[int, int, int, int]:
     """
     "#RRGGBB" → (R,G,B,A)
+    - 반환값이 불변 tuple이므로 색상별 결과를 캐시해 재사용
     """
     hex_color = hex_color.lstrip("#")
-    if len(hex_color) != 6:
+    if not _HEX_RGB_RE.fullmatch(hex_color):
         return (255, 255, 255, alpha)
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
-    return (r, g, b, alpha)
+    # 6자리를 한 번에 파싱한 뒤 시프트로 채널 분리
+    v = int(hex_color, 16)
+    return ((v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF, alpha)
@@ -21,11 +21,17 @@ Render Service (Final Composition)
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, Tuple, Optional
 
 from PIL import Image, ImageDraw, ImageFont
 
-from app.services.layout_service import resolve_text_layout
+from app.services.layout_service import (
+    ResolvedTextLayout,
+    resolve_text_layout,
+    hex_to_rgba,
+    FONT_PX,
+)
 from app.pipeline.plan import LayoutSpec, TextBlockLayout
 
 
@@ -59,7 +65,8 @@ def render_text_layers(
     Returns:
         PIL Image (RGBA)
     """
-    canvas = image.convert("RGBA")
+    # 이미 RGBA면 색공간 변환 없이 복사만 (입력 이미지는 수정하지 않음)
+    canvas = image.copy() if image.mode == "RGBA" else image.convert("RGBA")
     draw = ImageDraw.Draw(canvas)
 
     # Headline
@@ -92,6 +99,16 @@ def render_text_layers(
     return canvas
 
 
+def warmup_fonts(platform: str = "instagram") -> None:
+    """
+    플랫폼 기본 폰트 크기(regular/bold)를 미리 로드해 폰트 캐시를 채운다.
+    - 첫 렌더에서 FreeType 파싱 비용이 사용자 대기 시간에 포함되지 않도록 앱 시작 시 호출
+    """
+    for size in FONT_PX.get(platform, FONT_PX["instagram"]).values():
+        _cached_truetype(FONT_REGULAR, size)
+        _cached_truetype(FONT_BOLD, size)
+
+
 # -----------------------------
 # Internal Helpers
 # -----------------------------
@@ -109,14 +126,7 @@ def _draw_text_block(
     if not text:
         return
 
-    resolved = resolve_text_layout(
-        canvas_size=canvas.size,
-        position=spec.position,
-        font_size=spec.font_size,
-        color_hex=spec.color_hex,
-        emphasis=spec.emphasis.__dict__ if spec.emphasis else None,
-        platform=platform,
-    )
+    resolved = _resolve_block_layout(canvas.size, spec, platform)
 
     font = _load_font(
         style=spec.font_style,
@@ -146,6 +156,27 @@ def _draw_text_block(
     )
 
 
+@lru_cache(maxsize=256)
+def _resolve_block_layout(
+    canvas_size: Tuple[int, int],
+    spec: TextBlockLayout,
+    platform: str,
+) -> ResolvedTextLayout:
+    """
+    (캔버스 크기, 블록 스펙, 플랫폼) 별 레이아웃 해석 결과 재사용
+    - TextBlockLayout / EmphasisSpec은 frozen dataclass라 그대로 캐시 키로 사용
+    - 반환값은 공유되므로 읽기 전용으로 사용
+    """
+    return resolve_text_layout(
+        canvas_size=canvas_size,
+        position=spec.position,
+        font_size=spec.font_size,
+        color_hex=spec.color_hex,
+        emphasis=spec.emphasis.to_dict() if spec.emphasis else None,
+        platform=platform,
+    )
+
+
 def _draw_text_with_emphasis(
     *,
     draw: ImageDraw.ImageDraw,
@@ -164,29 +195,34 @@ def _draw_text_with_emphasis(
         draw.text(base_xy, text, font=base_font, fill=base_color, anchor=anchor)
         return
 
-    before, after = text.split(target, 1)
-
     # 강조 폰트
-    scale = float(emphasis.get("scale", 1.2))
-    emph_font = _load_font(
-        style="bold",
-        size=int(base_font.size * scale),
-    )
-    emph_color = _hex_to_rgba(emphasis.get("color_hex", "#FF4D4D"))
+    # scale은 정수 퍼센트로 양자화해 캐시 키를 안정화
+    scale_x100 = round(float(emphasis.get("scale", 1.2)) * 100)
+    emph_font = _emph_font(base_font.size, scale_x100)
+    emph_color = hex_to_rgba(emphasis.get("color_hex", "#FF4D4D"))
+
+    # 문장 전체가 강조어 (한 단어 헤드라인 등) → 분할/측정 없이 1회 렌더
+    # (아래 분할 경로와 같은 배치: 가로 중앙 + 세로 중앙)
+    if target == text:
+        draw.text(base_xy, text, font=emph_font, fill=emph_color, anchor="mm")
+        return
+
+    before, after = text.split(target, 1)
 
     # 기준점 보정: anchor 중앙 기준으로 왼쪽부터 직접 배치
     x, y = base_xy
 
-    # 전체 폭 계산
-    bw = base_font.getlength(before)
+    # 전체 폭 계산 (빈 구간은 측정/래스터화 생략 — 강조어가 문장 앞/뒤인 경우가 흔함)
+    bw = base_font.getlength(before) if before else 0.0
     tw = emph_font.getlength(target)
-    aw = base_font.getlength(after)
+    aw = base_font.getlength(after) if after else 0.0
     total_w = bw + tw + aw
 
     start_x = x - total_w / 2
 
     # before
-    draw.text((start_x, y), before, font=base_font, fill=base_color, anchor="lm")
+    if before:
+        draw.text((start_x, y), before, font=base_font, fill=base_color, anchor="lm")
     cur_x = start_x + bw
 
     # target
@@ -194,26 +230,34 @@ def _draw_text_with_emphasis(
     cur_x += tw
 
     # after
-    draw.text((cur_x, y), after, font=base_font, fill=base_color, anchor="lm")
+    if after:
+        draw.text((cur_x, y), after, font=base_font, fill=base_color, anchor="lm")
 
 
 def _load_font(*, style: str, size: int) -> ImageFont.FreeTypeFont:
     """
     한글 폰트 로드
     """
-    path = FONT_BOLD if style == "bold" else FONT_REGULAR
+    return _cached_truetype(FONT_BOLD if style == "bold" else FONT_REGULAR, size)
+
+
+@lru_cache(maxsize=64)
+def _emph_font(base_size: int, scale_x100: int) -> ImageFont.FreeTypeFont:
+    """
+    강조용 bold 폰트: (기본 크기, scale%) 조합별 1회 계산
+    """
+    return _cached_truetype(FONT_BOLD, base_size * scale_x100 // 100)
+
+
+@lru_cache(maxsize=128)
+def _cached_truetype(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """
+    (path, size) 별로 폰트 파일을 한 번만 파싱해 재사용
+    - 폴백 결과도 캐시되므로 폰트 파일이 없을 때 매번 open을 재시도하지 않음
+    - FreeTypeFont는 getlength / draw.text 등 읽기 전용 사용이므로 공유해도 안전
+    """
     try:
         return ImageFont.truetype(path, size)
     except Exception:
         # 최후의 폴백 (깨질 수 있음)
         return ImageFont.load_default()
-
-
-def _hex_to_rgba(hex_color: str, alpha: int = 255) -> Tuple[int, int, int, int]:
-    hex_color = hex_color.lstrip("#")
-    if len(hex_color) != 6:
-        return (255, 255, 255, alpha)
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
-    return (r, g, b, alpha)
@@ -0,0 +1,87 @@
+"""
+Async Background Writer
+
+역할:
+- 이미지 저장 / 이력 기록처럼 "버퍼링 가능한" 디스크 쓰기를
+  요청 스레드 대신 백그라운드 스레드 1개에서 순서대로 처리
+- 요청 스레드는 작업을 큐에 넣고 바로 반환 (spinner 시간에서 PNG 인코딩/쓰기 제외)
+
+주의:
+- 인증 상태 등 즉시 반영되어야 하는 쓰기는 이 모듈을 쓰지 않는다 (동기 유지)
+- 작업은 제출 순서대로 실행되므로, 같은 파일에 대한 쓰기 순서가 보장된다
+- 쓰기 결과를 바로 읽어야 하면 먼저 flush()를 호출한다
+"""
+
+from __future__ import annotations
+
+import atexit
+import queue
+import threading
+from typing import Callable, Optional
+
+from app.core.logging import log_error
+
+
+_QUEUE: "queue.Queue[Callable[[], None]]" = queue.Queue()
+_WORKER: Optional[threading.Thread] = None
+_WORKER_LOCK = threading.Lock()
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+def submit(task: Callable[[], None]) -> None:
+    """
+    백그라운드 쓰기 작업 제출 (즉시 반환)
+
+    - task는 writer 스레드에서 실행되므로 writer를 기다리면 안 된다
+      (flush() 호출, 다른 작업의 완료 대기 등 → 자기 자신을 기다리며 멈춤)
+    - 앞서 제출된 작업은 이미 끝난 상태이므로 그 결과 파일은 바로 읽어도 된다
+    """
+    _ensure_worker()
+    _QUEUE.put(task)
+
+
+def flush() -> None:
+    """
+    지금까지 제출된 작업이 모두 끝날 때까지 대기
+
+    - 워커 스레드 안(제출된 작업 내부)에서 호출되면 바로 반환
+      (자기 자신의 작업 완료를 기다리며 멈추지 않도록)
+    """
+    if _WORKER is None or threading.current_thread() is _WORKER:
+        return
+    _QUEUE.join()
+
+
+# -----------------------------
+# Worker
+# -----------------------------
+def _ensure_worker() -> None:
+    global _WORKER
+
+    if _WORKER is not None:
+        return
+
+    with _WORKER_LOCK:
+        if _WORKER is None:
+            worker = threading.Thread(
+                target=_run,
+                name="async-writer",
+                daemon=True,
+            )
+            worker.start()
+            atexit.register(flush)  # 종료 시 남은 쓰기 작업 마무리
+            _WORKER = worker
+
+
+def _run() -> None:
+    while True:
+        task = _QUEUE.get()
+        try:
+            task()
+        except Exception as e:
+            # 쓰기 실패가 워커 스레드를 멈추지 않도록 기록만 남김
+            log_error(message="백그라운드 쓰기 실패", action="async_write", exc=e)
+        finally:
+            _QUEUE.task_done()
@@ -5,19 +5,32 @@ Local File System Storage
 - 사용자별 파일 저장 (outputs/users/{email}/...)
 - 생성 이미지 저장
 - 업로드 파일 저장
-- 생성 이력(history.json) 관리
+- 생성 이력(history.jsonl) 관리
 - 상대 경로 ↔ 절대 경로 변환의 단일 진실(Single Source of Truth)
 """
 
 from __future__ import annotations
 
+import io
 import json
+import shutil
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any
 
-from PIL import Image
+from PIL import Image, features
+
+try:  # 선택 의존성: 설치되어 있으면 C 구현 직렬화 사용
+    import orjson
+except ImportError:
+    orjson = None
+
+from app.core.config import IMAGE_SAVE_FORMAT
+from app.storage import async_writer
 
 
 # ======================================================
@@ -29,10 +42,14 @@ USERS_DIR = BASE_OUTPUT_DIR / "users"
 BASE_OUTPUT_DIR.mkdir(exist_ok=True)
 USERS_DIR.mkdir(exist_ok=True)
 
+# 업로드 파일 복사 버퍼 크기
+_COPY_BUFSIZE = 1 << 20  # 1MiB
+
 
 # ======================================================
 # Utils
 # ======================================================
+@lru_cache(maxsize=256)
 def _safe_email(email: str) -> str:
     """
     이메일을 파일 경로에 안전한 문자열로 변환
@@ -40,12 +57,30 @@ def _safe_email(email: str) -> str:
     return email.lower().replace("@", "_at_").replace(".", "_dot_")
 
 
+@lru_cache(maxsize=256)
 def _user_root(email: str) -> Path:
+    """
+    사용자 루트 디렉터리 (이메일별 1회 생성 후 같은 Path 재사용)
+    """
     root = USERS_DIR / _safe_email(email)
-    root.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(root)
     return root
 
 
+# 이 프로세스에서 이미 생성/확인한 디렉터리 (반복 stat+mkdir 생략)
+_created_dirs: set[Path] = set()
+_created_dirs_lock = threading.Lock()
+
+
+def _ensure_dir(path: Path) -> None:
+    if path in _created_dirs:
+        return
+    with _created_dirs_lock:
+        if path not in _created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            _created_dirs.add(path)
+
+
 def generate_image_id(prefix: str = "img") -> str:
     return f"{prefix}_{uuid.uuid4().hex}"
 
@@ -53,27 +88,66 @@ def generate_image_id(prefix: str = "img") -> str:
 # ======================================================
 # Image Save / Load
 # ======================================================
+# 확장자 → (PIL 포맷, 인코딩 옵션)
+# - PNG: zlib level 1 (기본 6 대비 인코딩 ~4배 빠름, 용량 ~15% 증가)
+# - WebP: 무손실, method 4 (PNG보다 빠르고 용량도 비슷하거나 작음)
+_ENCODE_PARAMS: Dict[str, tuple[str, Dict[str, Any]]] = {
+    "png": ("PNG", {"optimize": False, "compress_level": 1}),
+    "webp": ("WEBP", {"lossless": True, "method": 4}),
+}
+
+
+@lru_cache(maxsize=8)
+def resolve_image_ext(ext: str = IMAGE_SAVE_FORMAT) -> str:
+    """
+    저장 확장자 결정 (호환을 위해 png로 폴백)
+    - 지원하지 않는 포맷이거나 Pillow가 WebP 없이 빌드된 경우 png
+    """
+    ext = ext.lower()
+    if ext not in _ENCODE_PARAMS:
+        return "png"
+    if ext == "webp" and not features.check("webp"):
+        return "png"
+    return ext
+
+
+def encode_image(pil_image: Image.Image, *, ext: str) -> bytes:
+    """
+    이미지를 파일 바이트로 인코딩 (파일 저장 / 다운로드 버튼 공용)
+    """
+    fmt, params = _ENCODE_PARAMS[ext]
+    buf = io.BytesIO()
+    pil_image.save(buf, format=fmt, **params)
+    return buf.getvalue()
+
+
 def save_image(
     *,
     email: str,
     pil_image: Image.Image,
     image_id: str,
-    ext: str = "png",
+    ext: str = IMAGE_SAVE_FORMAT,
 ) -> str:
     """
-    생성된 이미지를 저장
+    생성된 이미지를 저장 (백그라운드 스레드에서 인코딩/쓰기)
+
+    - 경로는 image_id로 결정되므로 저장 완료를 기다리지 않고 바로 반환
+    - 전달한 pil_image는 저장이 끝날 때까지 제자리 수정하지 않는다
+    - 파일을 바로 읽어야 하면 async_writer.flush() 후 접근
 
     Returns:
         사용자 기준 상대 경로 (예: images/xxx.png)
     """
     user_root = _user_root(email)
     images_dir = user_root / "images"
-    images_dir.mkdir(exist_ok=True)
+    _ensure_dir(images_dir)
 
+    ext = resolve_image_ext(ext)
     filename = f"{image_id}.{ext}"
     file_path = images_dir / filename
 
-    pil_image.save(file_path)
+    fmt, params = _ENCODE_PARAMS[ext]
+    async_writer.submit(lambda: pil_image.save(file_path, format=fmt, **params))
 
     return f"images/{filename}"
 
@@ -92,14 +166,16 @@ def save_uploaded_file(
     """
     user_root = _user_root(email)
     upload_dir = user_root / subdir
-    upload_dir.mkdir(exist_ok=True)
+    _ensure_dir(upload_dir)
 
     ext = Path(uploaded_file.name).suffix.lower()
     filename = f"{uuid.uuid4().hex}{ext}"
     file_path = upload_dir / filename
 
-    with open(file_path, "wb") as f:
-        f.write(uploaded_file.getbuffer())
+    # getbuffer() 복사 없이 1MiB 단위로 스트리밍 (fsync는 하지 않음)
+    uploaded_file.seek(0)  # 미리보기 등으로 이미 읽힌 경우 대비
+    with open(file_path, "wb", buffering=_COPY_BUFSIZE) as f:
+        shutil.copyfileobj(uploaded_file, f, length=_COPY_BUFSIZE)
 
     return f"{subdir}/{filename}"
 
@@ -112,20 +188,84 @@ def resolve_image_path(*, email: str, relative_path: str) -> Path:
 
 
 # ======================================================
-# History (JSON)
+# History (JSONL, append-only)
 # ======================================================
+_HISTORY_MIGRATE_LOCK = threading.Lock()
+
+
 def _history_file(email: str) -> Path:
-    return _user_root(email) / "history.json"
+    path = _user_root(email) / "history.jsonl"
+    _migrate_legacy_history(path)
+    return path
+
+
+def _migrate_legacy_history(path: Path) -> None:
+    """
+    구버전 history.json(JSON 배열) → history.jsonl 1회 변환
+    - 변환 후 원본은 history.json.migrated 로 보관
+    """
+    legacy = path.with_name("history.json")
+    if not legacy.exists():
+        return
+
+    with _HISTORY_MIGRATE_LOCK:
+        if not legacy.exists():  # 다른 스레드가 먼저 변환
+            return
+
+        records = _json_loads(legacy.read_bytes())
+
+        # 이력 쓰기는 모두 이 변환을 거친 뒤 수행되므로 덮어써도 안전
+        # (변환 중단 후 재시도 시에도 중복 없이 다시 생성)
+        with open(path, "wb") as f:
+            f.writelines(_json_line(r) for r in records)
+
+        legacy.replace(legacy.with_name("history.json.migrated"))
 
 
 def load_history(email: str) -> List[Dict[str, Any]]:
-    history_path = _history_file(email)
+    # 아직 큐에 남아 있는 append_history 반영 후 읽기
+    async_writer.flush()
+
+    return _read_history_file(_user_root(email) / "history.jsonl")
+
+
+def load_all_histories() -> Dict[str, List[Dict[str, Any]]]:
+    """
+    전체 사용자 이력 조회 (관리자용)
+
+    Returns:
+        {email: [record, ...]}
+    """
+    async_writer.flush()
+
+    user_dirs = sorted(d for d in USERS_DIR.iterdir() if d.is_dir())
+    if not user_dirs:
+        return {}
+
+    # 사용자별 파일 읽기는 I/O 대기 위주 → 스레드로 겹쳐서 처리 (순서는 유지)
+    with ThreadPoolExecutor(max_workers=min(32, len(user_dirs))) as ex:
+        results = ex.map(_read_history_file, (d / "history.jsonl" for d in user_dirs))
+        return {
+            _restore_email(d.name): records for d, records in zip(user_dirs, results)
+        }
+
 
-    if not history_path.exists():
+def _restore_email(safe: str) -> str:
+    """
+    _safe_email()의 역변환 (표시용)
+    """
+    return safe.replace("_at_", "@").replace("_dot_", ".")
+
+
+def _read_history_file(path: Path) -> List[Dict[str, Any]]:
+    _migrate_legacy_history(path)
+
+    if not path.exists():
         return []
 
-    with open(history_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # 한 줄씩 파싱 (빈 줄은 무시)
+    with open(path, "rb") as f:
+        return [_json_loads(line) for line in f if line.strip()]
 
 
 def append_history(
@@ -135,13 +275,31 @@ def append_history(
 ) -> None:
     """
     생성 이력 추가 (자동 timestamp 포함)
+    - timestamp는 호출 시점에 기록, 파일 갱신은 백그라운드 스레드에서 순서대로 처리
     """
-    history = load_history(email)
-
     record = dict(record)
     record["created_at"] = datetime.utcnow().isoformat()
 
-    history.append(record)
+    async_writer.submit(lambda: _write_history_record(email, record))
+
+
+def _write_history_record(email: str, record: Dict[str, Any]) -> None:
+    # 기존 이력을 다시 읽지 않고 한 줄만 추가 (O(1) append)
+    line = _json_line(record)
+    with open(_history_file(email), "ab") as f:
+        f.write(line)
+
+
+def _json_line(record: Dict[str, Any]) -> bytes:
+    """
+    레코드 1개 → UTF-8 JSON 한 줄 (개행 포함)
+    """
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
 
-    with open(_history_file(email), "w", encoding="utf-8") as f:
-        json.dump(history, f, ensure_ascii=False, indent=2)
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -15,6 +15,22 @@ import streamlit as st
 from app.core.auth import current_user_email, is_admin, logout
 
 
+# -----------------------------
+# Menu Definition (정적 → 모듈 상수)
+# -----------------------------
+_BASE_MENU: dict[str, str] = {
+    "🏠 홈": "home",
+    "📸 인스타 광고 만들기": "instagram_generate",
+    "📚 인스타 광고 이력": "instagram_history",
+}
+_ADMIN_MENU: dict[str, str] = {
+    **_BASE_MENU,
+    "🧑‍💼 관리자 대시보드": "admin_overview",
+}
+_BASE_LABELS: list[str] = list(_BASE_MENU)
+_ADMIN_LABELS: list[str] = list(_ADMIN_MENU)
+
+
 def render_navbar() -> str:
     """
     사이드바 네비게이션을 렌더링하고
@@ -32,20 +48,16 @@ def render_navbar() -> str:
         st.divider()
 
         # -----------------------------
-        # Menu Definition
+        # Menu Selection (rerun마다 dict/list를 새로 만들지 않음)
         # -----------------------------
-        menu = {
-            "🏠 홈": "home",
-            "📸 인스타 광고 만들기": "instagram_generate",
-            "📚 인스타 광고 이력": "instagram_history",
-        }
-
         if is_admin():
-            menu["🧑‍💼 관리자 대시보드"] = "admin_overview"
+            menu, labels = _ADMIN_MENU, _ADMIN_LABELS
+        else:
+            menu, labels = _BASE_MENU, _BASE_LABELS
 
         selected_label = st.radio(
             "메뉴",
-            list(menu.keys()),
+            labels,
             label_visibility="collapsed",
         )
 
@@ -10,15 +10,58 @@ Admin Overview Page (Streamlit)
 
 from __future__ import annotations
 
+import heapq
 from pathlib import Path
 import streamlit as st
 
 from app.core.guards import require_admin
-from app.core.config import OUTPUTS_DIR, LOG_FILE
+from app.core.config import OUTPUTS_DIR
 from app.storage.local_fs import load_all_histories
 from app.core.logging import read_recent_logs
 
 
+# -----------------------------
+# Data (cached)
+# -----------------------------
+@st.cache_data(ttl=30)
+def _recent_global_history(limit: int = 10) -> tuple[int, int, list[dict]]:
+    """
+    전체 이력 로드 + 평탄화 + 최신순 정렬 결과를 캐시
+    - 위젯 조작마다 일어나는 rerun에서 전체 사용자 파일을 다시 읽지 않음
+    - 새 이력은 TTL(30초) 경과 후 반영
+
+    Returns:
+        (전체 사용자 수, 전체 광고 수, 최근 이력 limit개)
+    """
+    histories = load_all_histories()
+
+    total_users = len(histories)
+    total_ads = sum(len(h) for h in histories.values())
+
+    # 최신순 상위 limit개만 선택 (전체 정렬/전체 복사 없이 O(N log limit))
+    top = heapq.nlargest(
+        limit,
+        ((email, item) for email, items in histories.items() for item in items),
+        key=lambda pair: pair[1].get("created_at", ""),
+    )
+
+    recent_items = []
+    for email, item in top:
+        item_copy = item.copy()
+        item_copy["user_email"] = email
+        recent_items.append(item_copy)
+
+    return total_users, total_ads, recent_items
+
+
+@st.cache_data(ttl=10)
+def _recent_logs(limit: int) -> list[str]:
+    """
+    최근 로그 캐시 (rerun마다 로그 파일을 다시 읽지 않음)
+    """
+    return read_recent_logs(limit=limit)
+
+
 # -----------------------------
 # Page Entry
 # -----------------------------
@@ -41,14 +84,11 @@ def run():
     # Load Global History
     # -----------------------------
     try:
-        histories = load_all_histories()
+        total_users, total_ads, recent_items = _recent_global_history(limit=10)
     except Exception as e:
         st.error("사용자 이력을 불러오는 중 오류가 발생했습니다.")
         st.stop()
 
-    total_users = len(histories)
-    total_ads = sum(len(h) for h in histories.values())
-
     # -----------------------------
     # KPI Summary
     # -----------------------------
@@ -64,20 +104,6 @@ def run():
     # -----------------------------
     st.subheader("🕒 최근 광고 생성 이력")
 
-    recent_items = []
-    for email, items in histories.items():
-        for item in items:
-            item_copy = item.copy()
-            item_copy["user_email"] = email
-            recent_items.append(item_copy)
-
-    # 최신순 정렬
-    recent_items = sorted(
-        recent_items,
-        key=lambda x: x.get("created_at", ""),
-        reverse=True,
-    )[:10]
-
     if not recent_items:
         st.info("아직 생성된 광고가 없습니다.")
     else:
@@ -101,7 +127,7 @@ def run():
     st.subheader("📄 최근 시스템 로그")
 
     try:
-        logs = read_recent_logs(limit=30)
+        logs = _recent_logs(limit=30)
     except Exception:
         st.warning("로그 파일을 불러올 수 없습니다.")
         return
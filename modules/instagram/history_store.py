@@ -0,0 +1,92 @@
+# ad_creator_platform/modules/instagram/history_store.py
+"""
+Instagram Ad - History Store
+
+역할:
+- 인스타 광고 생성 이력 파일 읽기/쓰기 (Streamlit 의존 없음)
+- Generate 페이지: submit_history()로 백그라운드 기록
+- History 페이지: load_history()로 조회
+
+저장 방식(현재):
+- 로컬 파일 기반 JSON 기록
+- outputs/history/instagram_history.json
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from app.storage import async_writer
+
+try:  # 선택 의존성: 설치되어 있으면 C 구현 직렬화 사용
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# -----------------------------
+# Paths
+# -----------------------------
+def history_file() -> Path:
+    root = Path(__file__).resolve().parents[2]  # ad_creator_platform/
+    return root / "outputs" / "history" / "instagram_history.json"
+
+
+# -----------------------------
+# Public API
+# -----------------------------
+def load_history() -> list[dict]:
+    """
+    이력 조회 (요청 스레드 전용)
+    - 백그라운드로 넘긴 이미지/이력 쓰기를 먼저 반영한 뒤 읽음
+    """
+    async_writer.flush()
+    return _read_history()
+
+
+def submit_history(record: dict) -> None:
+    """
+    Generate Page가 광고 생성 후 이력을 남길 때 사용 (즉시 반환)
+    record 예시:
+      {
+        "headline": "...",
+        "product": "...",
+        "tone": "...",
+        "discount": "...",
+        "created_at": "2026-01-31 10:00",
+        "image_path": "outputs/images/xxx.png"
+      }
+    """
+    async_writer.submit(lambda: _append_record(record))
+
+
+# -----------------------------
+# File I/O
+# -----------------------------
+def _append_record(record: dict) -> None:
+    # writer 스레드에서 실행: flush() 호출 금지
+    # (작업은 제출 순서대로 실행되므로 앞서 제출된 이력 쓰기는 이미 파일에 반영됨)
+    items = _read_history()
+    items.append(record)
+    _save_history(items)
+
+
+def _read_history() -> list[dict]:
+    path = history_file()
+    if not path.exists():
+        return []
+    try:
+        data = path.read_bytes()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except Exception:
+        return []
+
+
+def _save_history(items: list[dict]) -> None:
+    path = history_file()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(items, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(items, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -13,13 +13,22 @@ from __future__ import annotations
 
 import io
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 
 import streamlit as st
 from PIL import Image
 
+from app.core.config import HISTORY_ENABLED
+from app.storage import async_writer
+from app.storage.local_fs import encode_image, resolve_image_ext
 from modules.instagram.pipeline import generate_instagram_ad
-from modules.instagram.pages.history import append_history
+from modules.instagram.history_store import submit_history
+
+
+# copy dict → (headline, subcopy, cta) 한 번에 추출
+_COPY_FIELDS = itemgetter("headline", "subcopy", "cta")
 
 
 # -----------------------------
@@ -36,6 +45,19 @@ def _output_image_dir() -> Path:
     return path
 
 
+# -----------------------------
+# Image Helpers
+# -----------------------------
+@lru_cache(maxsize=4)
+def _decode_main_image(data: bytes) -> Image.Image:
+    """
+    업로드 이미지 디코딩 결과를 내용(bytes) 기준으로 재사용
+    - 같은 제품 사진으로 문구/톤만 바꿔 재생성할 때 디코딩+RGB 변환 생략
+    - 반환 이미지는 공유되므로 호출 측에서 제자리 수정하지 않는다
+    """
+    return Image.open(io.BytesIO(data)).convert("RGB")
+
+
 # -----------------------------
 # Page Entry
 # -----------------------------
@@ -94,7 +116,7 @@ def run() -> None:
     main_image: Image.Image | None = None
     if uploaded_image is not None:
         try:
-            main_image = Image.open(uploaded_image).convert("RGB")
+            main_image = _decode_main_image(uploaded_image.getvalue())
         except Exception:
             st.error("업로드한 이미지 파일을 불러올 수 없습니다.")
             return
@@ -116,28 +138,37 @@ def run() -> None:
             return
 
     final_image: Image.Image = result["image"]
+    headline, subcopy, cta = _COPY_FIELDS(result["copy"])
 
     # -----------------------------
     # Save Image (Local)
     # -----------------------------
     output_dir = _output_image_dir()
-    filename = f"instagram_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+    ext = resolve_image_ext()  # IMAGE_SAVE_FORMAT (기본 png)
+    filename = f"instagram_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{ext}"
     image_path = output_dir / filename
-    final_image.save(image_path, format="PNG")
+
+    # 인코딩은 1회만: 같은 bytes를 파일 저장과 다운로드 버튼에 재사용
+    image_bytes = encode_image(final_image, ext=ext)
+
+    # 디스크 쓰기/이력 기록은 백그라운드 writer에 맡기고 결과를 바로 표시
+    # (History 페이지는 읽기 전에 flush하므로 항상 반영된 상태로 보임)
+    async_writer.submit(lambda: image_path.write_bytes(image_bytes))
 
     # -----------------------------
     # Save History
     # -----------------------------
-    append_history(
-        {
-            "headline": result["copy"]["headline"],
+    # HISTORY_ENABLED=0 이면 레코드 구성부터 생략
+    if HISTORY_ENABLED:
+        record = {
+            "headline": headline,
             "product": product,
             "tone": tone,
             "discount": discount or "",
             "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "image_path": str(image_path),
         }
-    )
+        submit_history(record)
 
     # -----------------------------
     # Result Display
@@ -146,7 +177,7 @@ def run() -> None:
 
     st.image(
         final_image,
-        caption=result["copy"]["headline"],
+        caption=headline,
         width=600,
     )
 
@@ -157,31 +188,28 @@ def run() -> None:
         st.markdown(
             f"""
 **Headline**  
-{result["copy"]["headline"]}
+{headline}
 
 **Subcopy**  
-{result["copy"]["subcopy"]}
+{subcopy}
 
 **CTA**  
-{result["copy"]["cta"]}
+{cta}
 """
         )
 
     # -----------------------------
     # Download
     # -----------------------------
-    buf = io.BytesIO()
-    final_image.save(buf, format="PNG")
-    buf.seek(0)
-
     st.download_button(
-        label="⬇️ 이미지 다운로드 (PNG)",
-        data=buf,
+        label=f"⬇️ 이미지 다운로드 ({ext.upper()})",
+        data=image_bytes,
         file_name=filename,
-        mime="image/png",
+        mime=f"image/{ext}",
         use_container_width=True,
     )
 
-    st.info(
-        "이 광고 이미지는 자동으로 저장되며, **[이력] 페이지**에서 다시 확인할 수 있습니다."
-    )
+    if HISTORY_ENABLED:
+        st.info(
+            "이 광고 이미지는 자동으로 저장되며, **[이력] 페이지**에서 다시 확인할 수 있습니다."
+        )
@@ -8,7 +8,7 @@ Instagram Ad - History Page (Streamlit)
 - 재다운로드
 
 저장 방식(현재):
-- 로컬 파일 기반 JSON 기록
+- 로컬 파일 기반 JSON 기록 (modules/instagram/history_store.py)
 - outputs/history/instagram_history.json
 
 추후:
@@ -17,33 +17,40 @@ Instagram Ad - History Page (Streamlit)
 
 from __future__ import annotations
 
-import json
+import io
 from pathlib import Path
 import streamlit as st
+from PIL import Image
+
+from modules.instagram.history_store import load_history
 
 
 # -----------------------------
-# History Store (Local JSON)
+# Image Cache
 # -----------------------------
-def _history_file() -> Path:
-    root = Path(__file__).resolve().parents[3]  # ad_creator_platform/
-    return root / "outputs" / "history" / "instagram_history.json"
-
-
-def _load_history() -> list[dict]:
-    path = _history_file()
-    if not path.exists():
-        return []
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return []
+@st.cache_resource(max_entries=64)
+def _image_bytes(path_str: str, mtime: float) -> bytes:
+    """
+    다운로드용 이미지 bytes 캐시
+    - rerun(위젯 클릭)마다 모든 이력 이미지를 디스크에서 다시 읽지 않음
+    - mtime을 키에 포함해 같은 경로의 파일이 바뀌면 다시 읽음
+    """
+    return Path(path_str).read_bytes()
 
 
-def _save_history(items: list[dict]) -> None:
-    path = _history_file()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(items, ensure_ascii=False, indent=2), encoding="utf-8")
+@st.cache_resource(max_entries=64)
+def _thumb(path_str: str, mtime: float, max_px: int = 600) -> bytes:
+    """
+    미리보기용 썸네일(JPEG) 1회 생성 후 재사용
+    - 원본 PNG(최대 2048px)를 매 rerun마다 브라우저로 보내지 않음
+    - 원본 파일은 다운로드 버튼에서만 사용
+    """
+    with Image.open(path_str) as im:
+        im = im.convert("RGB")  # JPEG는 알파 미지원
+        im.thumbnail((max_px, max_px), Image.Resampling.BILINEAR)
+        buf = io.BytesIO()
+        im.save(buf, format="JPEG", quality=85)
+    return buf.getvalue()
 
 
 # -----------------------------
@@ -55,7 +62,7 @@ def run() -> None:
 
     st.divider()
 
-    history = _load_history()
+    history = load_history()
 
     if not history:
         st.info("아직 생성된 이력이 없습니다. 먼저 광고를 만들어 보세요.")
@@ -82,39 +89,19 @@ def run() -> None:
             )
 
             if image_path and Path(image_path).exists():
-                st.image(str(image_path), width=600)
-
-                with open(image_path, "rb") as f:
-                    st.download_button(
-                        label="⬇️ 이미지 다운로드 (PNG)",
-                        data=f,
-                        file_name=Path(image_path).name,
-                        mime="image/png",
-                        use_container_width=True,
-                    )
+                mtime = Path(image_path).stat().st_mtime
+                st.image(_thumb(str(image_path), mtime), width=600)
+
+                # 포맷은 현재 설정이 아니라 파일 확장자 기준 (과거 이력은 PNG)
+                ext = Path(image_path).suffix.lstrip(".").lower() or "png"
+                st.download_button(
+                    label=f"⬇️ 이미지 다운로드 ({ext.upper()})",
+                    data=_image_bytes(str(image_path), mtime),
+                    file_name=Path(image_path).name,
+                    mime=f"image/{ext}",
+                    use_container_width=True,
+                )
             else:
                 st.warning(
                     "이미지 파일이 존재하지 않습니다. (로컬 파일 경로 확인 필요)"
                 )
-
-
-# -----------------------------
-# Helper for saving history
-# (Generate 페이지에서 호출 가능)
-# -----------------------------
-def append_history(record: dict) -> None:
-    """
-    Generate Page가 광고 생성 후 이력을 남길 때 사용
-    record 예시:
-      {
-        "headline": "...",
-        "product": "...",
-        "tone": "...",
-        "discount": "...",
-        "created_at": "2026-01-31 10:00",
-        "image_path": "outputs/images/xxx.png"
-      }
-    """
-    items = _load_history()
-    items.append(record)
-    _save_history(items)
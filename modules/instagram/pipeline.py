@@ -15,12 +15,16 @@ Instagram Ad Generation Pipeline
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
 
 from PIL import Image
 
 # ---- Pipeline Stages ----
-from pipeline.plan import build_plan
+from pipeline.plan import Plan, build_plan
 from pipeline.segment import segment_product, SegmentConfig
 from pipeline.background import generate_background, BackgroundConfig
 from pipeline.relight import relight_and_compose, RelightConfig
@@ -29,6 +33,129 @@ from pipeline.upscale import upscale_image, UpscaleConfig
 # ---- Render ----
 from app.services.render_service import render_text_layers
 
+from app.core.config import PLAN_CACHE_ENABLED
+
+
+# -----------------------------
+# Stage Configs (불변 → 요청마다 새로 만들지 않음)
+# -----------------------------
+_SEG_FALLBACK = SegmentConfig(backend="fallback")  # 나중에 "birefnet"으로 교체
+_RELIGHT_FALLBACK = RelightConfig(backend="fallback")  # 나중에 "ic_light"로 교체
+
+
+@lru_cache(maxsize=8)
+def _upscale_cfg(canvas_size: Tuple[int, int]) -> UpscaleConfig:
+    return UpscaleConfig(
+        backend="fallback",
+        scale=1,  # 인스타 기본은 1 (나중에 2x/4x 가능)
+        max_size=canvas_size,
+    )
+
+
+def _maybe_upscale(image: Image.Image, cfg: UpscaleConfig) -> Image.Image:
+    """
+    scale=1 이고 이미 max_size 안에 들어오면 업스케일 단계 자체를 생략
+    - fallback backend가 같은 조건에서 입력을 그대로 반환하는 것과 동일한 결과
+    """
+    if cfg.scale == 1 and (
+        cfg.max_size is None
+        or (image.width <= cfg.max_size[0] and image.height <= cfg.max_size[1])
+    ):
+        return image
+    return upscale_image(image=image, config=cfg)
+
+
+# -----------------------------
+# Plan
+# -----------------------------
+def _get_plan(
+    *,
+    product: str,
+    tone: str,
+    discount: Optional[str],
+    prompt_extra: Optional[str],
+) -> Plan:
+    """
+    같은 입력이면 Plan 재사용 (pipeline.plan의 규칙 기반 캐시)
+    - PLAN_CACHE_ENABLED=0 이면 매번 새로 생성 (비결정적 LLM 모드)
+    """
+    return build_plan(
+        product=product,
+        tone=tone,  # type: ignore[arg-type]
+        discount=discount,
+        prompt_extra=prompt_extra,
+        use_cache=PLAN_CACHE_ENABLED,
+    )
+
+
+# -----------------------------
+# Background Cache
+# -----------------------------
+# (prompt, BackgroundConfig) → 배경 이미지
+# - 같은 상품/분위기로 문구·톤만 바꿔 재생성할 때 배경 생성(추후 diffusion)을 생략
+# - BackgroundConfig는 frozen dataclass라 size/모델 힌트까지 그대로 키에 포함됨
+# - 캐시된 이미지는 공유되므로 하위 단계는 제자리 수정하지 않는다
+#   (relight/render는 항상 복사본에 합성)
+_BG_CACHE: "OrderedDict[Tuple[str, BackgroundConfig], Image.Image]" = OrderedDict()
+_BG_CACHE_MAX = 32
+_BG_CACHE_LOCK = threading.Lock()
+
+
+def _get_or_generate_background(
+    key: Tuple[str, BackgroundConfig],
+    fn: Callable[[], Image.Image],
+) -> Image.Image:
+    with _BG_CACHE_LOCK:
+        cached = _BG_CACHE.get(key)
+        if cached is not None:
+            _BG_CACHE.move_to_end(key)
+            return cached
+
+    # 생성은 락 밖에서 (느린 backend가 다른 요청의 캐시 조회를 막지 않도록)
+    image = fn()
+
+    with _BG_CACHE_LOCK:
+        _BG_CACHE[key] = image
+        _BG_CACHE.move_to_end(key)
+        while len(_BG_CACHE) > _BG_CACHE_MAX:
+            _BG_CACHE.popitem(last=False)
+    return image
+
+
+# -----------------------------
+# Visual Cache
+# -----------------------------
+# (배경 프롬프트, 모델 힌트, 캔버스 크기, 제품 이미지) → 텍스트 합성 전 이미지
+# - 제품 이미지는 id()로 구분하고 값에 참조를 함께 보관
+#   (보관 중에는 id가 재사용되지 않으며, 조회 시 동일 객체인지 다시 확인)
+# - Generate 페이지는 같은 업로드에 대해 디코딩 캐시의 같은 객체를 넘김
+_VISUAL_CACHE: "OrderedDict[tuple, Tuple[Optional[Image.Image], Image.Image]]" = (
+    OrderedDict()
+)
+_VISUAL_CACHE_MAX = 16
+_VISUAL_CACHE_LOCK = threading.Lock()
+
+
+def _get_or_compose_visual(
+    key: tuple,
+    main_image: Optional[Image.Image],
+    fn: Callable[[], Image.Image],
+) -> Image.Image:
+    with _VISUAL_CACHE_LOCK:
+        entry = _VISUAL_CACHE.get(key)
+        if entry is not None and entry[0] is main_image:
+            _VISUAL_CACHE.move_to_end(key)
+            return entry[1]
+
+    image = fn()
+
+    with _VISUAL_CACHE_LOCK:
+        _VISUAL_CACHE[key] = (main_image, image)
+        _VISUAL_CACHE.move_to_end(key)
+        while len(_VISUAL_CACHE) > _VISUAL_CACHE_MAX:
+            _VISUAL_CACHE.popitem(last=False)
+    return image
+
 
 # -----------------------------
 # Public API
@@ -67,38 +194,98 @@ def generate_instagram_ad(
     # -----------------------------
     # 1) PLAN (LLM / Rule)
     # -----------------------------
-    plan = build_plan(
+    plan = _get_plan(
         product=product,
-        tone=tone,  # type: ignore[arg-type]
+        tone=tone,
         discount=discount,
         prompt_extra=prompt_extra,
     )
 
+    # 렌더와 결과 반환에 같은 dict 사용 (render_text_layers는 읽기만 함)
+    copy_dict = plan.copy.to_dict()
+    layout = plan.layout
+    bg_prompt = plan.background_prompt
+
     # -----------------------------
-    # 2) BACKGROUND
+    # 2~5) VISUAL (background → segment → relight → upscale)
     # -----------------------------
-    bg = generate_background(
-        prompt=plan.background_prompt,
-        config=BackgroundConfig(
-            size=canvas_size,
-            lora_key=plan.model_hints.lora_key,
-            control_hint=plan.model_hints.control_hint,
-            ip_adapter_ref=plan.model_hints.ip_adapter_ref,
+    # 문구(copy)만 바뀐 재생성이면 텍스트 합성 전 이미지를 재사용
+    upscaled = _get_or_compose_visual(
+        (bg_prompt, plan.model_hints, canvas_size, id(main_image)),
+        main_image,
+        lambda: _compose_visual(
+            plan=plan,
+            main_image=main_image,
+            canvas_size=canvas_size,
         ),
     )
 
     # -----------------------------
-    # 3) SEGMENT (optional)
+    # 6) RENDER TEXT (FINAL)
     # -----------------------------
-    fg_rgba: Optional[Image.Image] = None
-    if main_image is not None:
-        fg_rgba = segment_product(
-            image=main_image,
-            config=SegmentConfig(
-                backend="fallback",  # 나중에 "birefnet"으로 교체
-            ),
+    final_image = render_text_layers(
+        image=upscaled,
+        copy=copy_dict,
+        layout=layout,
+        platform="instagram",
+    )
+
+    # -----------------------------
+    # Result
+    # -----------------------------
+    return {
+        "image": final_image,
+        "copy": copy_dict,
+        "layout": layout,
+        "background_prompt": bg_prompt,
+    }
+
+
+# -----------------------------
+# Internal Stages
+# -----------------------------
+def _compose_visual(
+    *,
+    plan: Plan,
+    main_image: Optional[Image.Image],
+    canvas_size: Tuple[int, int],
+) -> Image.Image:
+    """
+    텍스트 합성 전 단계(2~5)까지의 이미지 생성
+    """
+    # -----------------------------
+    # 2) BACKGROUND + 3) SEGMENT (optional)
+    # -----------------------------
+    # 두 단계는 서로 독립 (배경: 프롬프트만, 분리: 제품 이미지만 필요)
+    # → 제품 이미지가 있으면 분리는 워커 스레드, 배경은 현재 스레드에서 동시에 실행
+    mh = plan.model_hints
+    bg_prompt = plan.background_prompt
+    bg_cfg = BackgroundConfig(
+        size=canvas_size,
+        lora_key=mh.lora_key,
+        control_hint=mh.control_hint,
+        ip_adapter_ref=mh.ip_adapter_ref,
+    )
+
+    def _background() -> Image.Image:
+        return _get_or_generate_background(
+            (bg_prompt, bg_cfg),
+            lambda: generate_background(prompt=bg_prompt, config=bg_cfg),
         )
 
+    fg_rgba: Optional[Image.Image] = None
+    if main_image is None:
+        bg = _background()
+    else:
+        with ThreadPoolExecutor(max_workers=1) as ex:
+            seg_fut = ex.submit(
+                segment_product,
+                image=main_image,
+                config=_SEG_FALLBACK,
+            )
+            bg = _background()
+            fg_rgba = seg_fut.result()
+
     # -----------------------------
     # 4) RELIGHT (compose)
     # -----------------------------
@@ -106,9 +293,7 @@ def generate_instagram_ad(
         composed = relight_and_compose(
             background=bg,
             foreground_rgba=fg_rgba,
-            config=RelightConfig(
-                backend="fallback",  # 나중에 "ic_light"로 교체
-            ),
+            config=_RELIGHT_FALLBACK,
         )
     else:
         composed = bg
@@ -116,39 +301,4 @@ def generate_instagram_ad(
     # -----------------------------
     # 5) UPSCALE
     # -----------------------------
-    upscaled = upscale_image(
-        image=composed,
-        config=UpscaleConfig(
-            backend="fallback",
-            scale=1,  # 인스타 기본은 1 (나중에 2x/4x 가능)
-            max_size=canvas_size,
-        ),
-    )
-
-    # -----------------------------
-    # 6) RENDER TEXT (FINAL)
-    # -----------------------------
-    final_image = render_text_layers(
-        image=upscaled,
-        copy={
-            "headline": plan.copy.headline,
-            "subcopy": plan.copy.subcopy,
-            "cta": plan.copy.cta,
-        },
-        layout=plan.layout,
-        platform="instagram",
-    )
-
-    # -----------------------------
-    # Result
-    # -----------------------------
-    return {
-        "image": final_image,
-        "copy": {
-            "headline": plan.copy.headline,
-            "subcopy": plan.copy.subcopy,
-            "cta": plan.copy.cta,
-        },
-        "layout": plan.layout,
-        "background_prompt": plan.background_prompt,
-    }
+    return _maybe_upscale(composed, _upscale_cfg(canvas_size))
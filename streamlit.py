@@ -5,33 +5,35 @@ st.set_page_config(page_title="ChatGPT-style UI", layout="centered")
 # -----------------------------
 # 1. 세션 상태 초기화
 # -----------------------------
-if "messages" not in st.session_state:
-    st.session_state.messages = []
-
-if "task_mode" not in st.session_state:
-    st.session_state.task_mode = "문서 생성"
+st.session_state.setdefault("messages", [])
 
 # -----------------------------
 # 2. 작업 모드 정의
 # -----------------------------
-TASK_CONFIG = {
-    "문서 생성": {
-        "placeholder": "작성할 문서의 주제나 요구사항을 입력하세요",
-        "system_hint": "문서를 생성합니다."
-    },
-    "번역": {
-        "placeholder": "번역할 텍스트를 입력하세요",
-        "system_hint": "번역을 수행합니다."
-    },
-    "요약": {
-        "placeholder": "요약할 내용을 입력하세요",
-        "system_hint": "요약을 수행합니다."
-    },
-    "코드 작성": {
-        "placeholder": "작성할 코드에 대한 설명을 입력하세요",
-        "system_hint": "코드를 생성합니다."
-    },
-}
+@st.cache_resource
+def _task_config() -> dict:
+    # rerun마다 dict 리터럴을 다시 만들지 않고 같은 객체 재사용 (읽기 전용)
+    return {
+        "문서 생성": {
+            "placeholder": "작성할 문서의 주제나 요구사항을 입력하세요",
+            "system_hint": "문서를 생성합니다."
+        },
+        "번역": {
+            "placeholder": "번역할 텍스트를 입력하세요",
+            "system_hint": "번역을 수행합니다."
+        },
+        "요약": {
+            "placeholder": "요약할 내용을 입력하세요",
+            "system_hint": "요약을 수행합니다."
+        },
+        "코드 작성": {
+            "placeholder": "작성할 코드에 대한 설명을 입력하세요",
+            "system_hint": "코드를 생성합니다."
+        },
+    }
+
+
+TASK_CONFIG = _task_config()
 
 # -----------------------------
 # 3. 기존 대화 렌더링 (말풍선)
@@ -43,16 +45,15 @@ for msg in st.session_state.messages:
 # -----------------------------
 # 4. 하단 작업 선택 바 (ChatGPT 스타일)
 # -----------------------------
-cols = st.columns(len(TASK_CONFIG))
-
-for col, mode in zip(cols, TASK_CONFIG.keys()):
-    with col:
-        if st.button(
-            mode,
-            use_container_width=True,
-            type="primary" if st.session_state.task_mode == mode else "secondary",
-        ):
-            st.session_state.task_mode = mode
+# 단일 위젯 + key 바인딩: 선택값이 바로 st.session_state.task_mode에 반영됨
+# (기본값은 첫 항목 "문서 생성")
+st.radio(
+    "작업",
+    list(TASK_CONFIG.keys()),
+    horizontal=True,
+    key="task_mode",
+    label_visibility="collapsed",
+)
 
 # -----------------------------
 # 5. 선택에 따라 placeholder 변경
@@ -62,7 +63,19 @@ user_input = st.chat_input(
 )
 
 # -----------------------------
-# 6. 입력 처리
+# 6. 응답 스트리밍
+# -----------------------------
+def _stream_response(task_mode: str, user_input: str):
+    # (예시용) 어시스턴트 응답을 조각 단위로 내보냄 → 첫 글자부터 바로 그려짐
+    yield f"🛠 선택된 작업: **{task_mode}**\n\n"
+    yield TASK_CONFIG[task_mode]["system_hint"] + "\n\n"
+    yield "입력 내용:\n"
+    # 줄바꿈을 보존하기 위해 줄 단위로 전달
+    yield from user_input.splitlines(keepends=True)
+
+
+# -----------------------------
+# 7. 입력 처리
 # -----------------------------
 if user_input:
     # 사용자 메시지 저장
@@ -70,20 +83,16 @@ if user_input:
         {"role": "user", "content": user_input}
     )
 
-    # 사용자 말풍선
+    # 이번 턴의 말풍선은 바로 그림 (rerun 없이 스트리밍)
+    # 다음 rerun부터는 상단 대화 렌더링 루프에서 그려짐
     with st.chat_message("user"):
         st.markdown(user_input)
 
-    # (예시용) 어시스턴트 응답
-    assistant_response = (
-        f"🛠 선택된 작업: **{st.session_state.task_mode}**\n\n"
-        f"{TASK_CONFIG[st.session_state.task_mode]['system_hint']}\n\n"
-        f"입력 내용:\n{user_input}"
-    )
+    with st.chat_message("assistant"):
+        response_text = st.write_stream(
+            _stream_response(st.session_state.task_mode, user_input)
+        )
 
     st.session_state.messages.append(
-        {"role": "assistant", "content": assistant_response}
+        {"role": "assistant", "content": response_text}
     )
-
-    with st.chat_message("assistant"):
-        st.markdown(assistant_response)
@@ -0,0 +1,64 @@
+"""
+async_writer / History 연동 테스트
+
+- 워커 스레드 안에서 flush()가 호출되어도 멈추지 않는지
+- submit_history로 넘긴 이력이 writer를 기다리지 않고 디스크에 남는지
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+
+from app.storage import async_writer
+from modules.instagram import history_store
+
+
+_TIMEOUT_SEC = 5.0
+
+
+def _flush_with_timeout(flush=async_writer.flush) -> bool:
+    """
+    flush()를 별도 스레드에서 호출하고, 제한 시간 안에 반환되었는지 확인
+    """
+    t = threading.Thread(target=flush, daemon=True)
+    t.start()
+    t.join(_TIMEOUT_SEC)
+    return not t.is_alive()
+
+
+def test_flush_inside_task_does_not_deadlock():
+    done = threading.Event()
+
+    def task() -> None:
+        async_writer.flush()  # 워커 스레드 안에서 호출
+        done.set()
+
+    async_writer.submit(task)
+
+    assert _flush_with_timeout()
+    assert done.is_set()
+
+
+def test_submitted_history_lands_on_disk(tmp_path, monkeypatch):
+    history_file = tmp_path / "history" / "instagram_history.json"
+    monkeypatch.setattr(history_store, "history_file", lambda: history_file)
+
+    # 제출된 작업은 writer를 기다리면 안 됨 → 작업 중 flush() 호출을 기록
+    flush = async_writer.flush
+    flushed_on_worker = []
+
+    def guarded_flush() -> None:
+        flushed_on_worker.append(threading.current_thread().name)
+        flush()
+
+    monkeypatch.setattr(async_writer, "flush", guarded_flush)
+
+    records = [{"headline": f"테스트 {i}", "image_path": f"{i}.png"} for i in range(3)]
+    for record in records:
+        history_store.submit_history(record)
+
+    assert _flush_with_timeout(flush)
+    assert flushed_on_worker == []
+    assert json.loads(history_file.read_text(encoding="utf-8")) == records
+    assert history_store.load_history() == records